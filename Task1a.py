@@ -8,47 +8,157 @@ It uses the Weiszfeld iterative method to locate the geometric median.
 
 import math
 
+import numpy as np
 
-def distance_between_points(point1, point2):
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; the NumPy path is used instead
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return lambda func: func
+
+
+def _to_soa(sensors):
     """
-    Calculate Euclidean distance between two 2D points.
+    Convert sensor coordinates to structure-of-arrays form.
     
     Args:
-        point1: [x, y] coordinates of first point
-        point2: [x, y] coordinates of second point
+        sensors: List of [x, y] sensor coordinates (or an (N, 2) array)
     
     Returns:
-        float: The Euclidean distance
+        tuple: (xs, ys) contiguous float64 arrays
     """
-    dx = point1[0] - point2[0]
-    dy = point1[1] - point2[1]
-    return math.sqrt(dx * dx + dy * dy)
+    arr = np.asarray(sensors, dtype=np.float64)
+    return arr[:, 0].copy(), arr[:, 1].copy()
 
 
-def calculate_initial_hub(sensors):
+def calculate_initial_hub(xs, ys):
     """
     Initialize hub position at the centroid (average) of all sensors.
     
     Args:
-        sensors: List of [x, y] sensor coordinates
+        xs: Array of sensor x coordinates
+        ys: Array of sensor y coordinates
     
     Returns:
-        list: [hub_x, hub_y] at centroid position
+        np.ndarray: [hub_x, hub_y] at centroid position
+    """
+    return np.array([xs.mean(), ys.mean()])
+
+
+@njit(fastmath=True, cache=True)
+def _weiszfeld_core(xs, ys, max_iter, tol, eta):
     """
-    sum_x = 0
-    sum_y = 0
+    Compiled Weiszfeld refinement over float64 coordinate arrays.
     
-    for sensor in sensors:
-        sum_x = sum_x + sensor[0]
-        sum_y = sum_y + sensor[1]
+    Uses scalar accumulators and a single pass over the sensors per
+    iteration, so the whole refinement runs without interpreter overhead.
     
-    hub_x = sum_x / len(sensors)
-    hub_y = sum_y / len(sensors)
+    Args:
+        xs: Array of sensor x coordinates
+        ys: Array of sensor y coordinates
+        max_iter (int): Maximum number of iterations
+        tol (float): Convergence threshold on hub movement
+        eta (float): Minimum distance used to avoid division by zero
+    
+    Returns:
+        tuple: (hub_x, hub_y)
+    """
+    n = xs.shape[0]
+    
+    # Start at the centroid
+    hx = 0.0
+    hy = 0.0
+    for i in range(n):
+        hx += xs[i]
+        hy += ys[i]
+    hx /= n
+    hy /= n
+    
+    # Compare squared movement so the convergence test needs no sqrt
+    tol2 = tol * tol
+    
+    for _ in range(max_iter):
+        weighted_x = 0.0
+        weighted_y = 0.0
+        total_weight = 0.0
+        
+        for i in range(n):
+            dx = xs[i] - hx
+            dy = ys[i] - hy
+            d = math.sqrt(dx * dx + dy * dy)
+            if d < eta:
+                d = eta
+            w = 1.0 / d
+            weighted_x += w * xs[i]
+            weighted_y += w * ys[i]
+            total_weight += w
+        
+        new_x = weighted_x / total_weight
+        new_y = weighted_y / total_weight
+        mx = new_x - hx
+        my = new_y - hy
+        hx = new_x
+        hy = new_y
+        
+        if mx * mx + my * my < tol2:
+            break
     
-    return [hub_x, hub_y]
+    return hx, hy
 
 
-def weiszfeld_optimization(sensors):
+def _weiszfeld_vectorized(xs, ys, max_iter, tol, eta):
+    """
+    NumPy Weiszfeld refinement, used when Numba is not available.
+    
+    Args:
+        xs: Array of sensor x coordinates
+        ys: Array of sensor y coordinates
+        max_iter (int): Maximum number of iterations
+        tol (float): Convergence threshold on hub movement
+        eta (float): Minimum distance used to avoid division by zero
+    
+    Returns:
+        np.ndarray: [hub_x, hub_y]
+    """
+    current_hub = calculate_initial_hub(xs, ys)
+    tol2 = tol * tol
+    
+    for iteration in range(max_iter):
+        hub_x = current_hub[0]
+        hub_y = current_hub[1]
+        
+        # Distance from current hub to every sensor
+        dx = xs - hub_x
+        dy = ys - hub_y
+        dist = np.sqrt(dx * dx + dy * dy)
+        
+        # Handle case where hub is exactly on a sensor
+        np.maximum(dist, eta, out=dist)
+        
+        # Weight is inverse of distance (closer sensors have higher weight)
+        inv_dist = 1.0 / dist
+        
+        # New hub position is the weighted average of sensor positions;
+        # one dot product per SoA coordinate array, no stacked copy
+        total_weight = inv_dist.sum()
+        current_hub[0] = (xs @ inv_dist) / total_weight
+        current_hub[1] = (ys @ inv_dist) / total_weight
+        
+        # Check if hub has converged (squared movement is very small)
+        mx = current_hub[0] - hub_x
+        my = current_hub[1] - hub_y
+        
+        if mx * mx + my * my < tol2:
+            break  # Convergence reached, stop iterations
+    
+    return current_hub
+
+
+def weiszfeld_optimization(xs, ys):
     """
     Apply Weiszfeld algorithm to find the optimal hub location.
     
@@ -58,79 +168,44 @@ def weiszfeld_optimization(sensors):
     3. Move hub to weighted average position
     4. Repeat until convergence
     
+    The refinement runs in a Numba-compiled loop when Numba is installed,
+    and as vectorized NumPy otherwise.
+    
     Args:
-        sensors: List of [x, y] sensor coordinates
+        xs: Array of sensor x coordinates
+        ys: Array of sensor y coordinates
     
     Returns:
-        list: [optimal_hub_x, optimal_hub_y]
+        np.ndarray: [optimal_hub_x, optimal_hub_y]
     """
     
-    # Step 1: Initialize hub at centroid
-    current_hub = calculate_initial_hub(sensors)
-    
-    # Step 2: Set optimization parameters
+    # Optimization parameters
     max_iterations = 100
     convergence_threshold = 1e-7
     min_distance = 1e-10  # Prevent division by zero
     
-    # Step 3: Iterative refinement
-    for iteration in range(max_iterations):
-        # Store previous hub to check convergence
-        previous_hub = [current_hub[0], current_hub[1]]
-        
-        # Calculate weighted sum
-        weighted_x = 0
-        weighted_y = 0
-        total_weight = 0
-        
-        # For each sensor, calculate its contribution based on inverse distance
-        for sensor in sensors:
-            # Calculate distance from current hub to this sensor
-            dist = distance_between_points(current_hub, sensor)
-            
-            # Handle case where hub is exactly on a sensor
-            if dist < min_distance:
-                dist = min_distance
-            
-            # Weight is inverse of distance (closer sensors have higher weight)
-            weight = 1.0 / dist
-            
-            # Accumulate weighted sensor positions
-            weighted_x = weighted_x + weight * sensor[0]
-            weighted_y = weighted_y + weight * sensor[1]
-            total_weight = total_weight + weight
-        
-        # Calculate new hub position as weighted average
-        current_hub[0] = weighted_x / total_weight
-        current_hub[1] = weighted_y / total_weight
-        
-        # Check if hub has converged (movement is very small)
-        hub_movement = distance_between_points(current_hub, previous_hub)
-        
-        if hub_movement < convergence_threshold:
-            break  # Convergence reached, stop iterations
+    if NUMBA_AVAILABLE:
+        hub_x, hub_y = _weiszfeld_core(xs, ys, max_iterations, convergence_threshold, min_distance)
+        return np.array([hub_x, hub_y])
     
-    return current_hub
+    return _weiszfeld_vectorized(xs, ys, max_iterations, convergence_threshold, min_distance)
 
 
-def calculate_total_distance(hub, sensors):
+def calculate_total_distance(hub, xs, ys):
     """
     Calculate the total distance from hub to all sensors.
     
     Args:
         hub: [hub_x, hub_y] position
-        sensors: List of [x, y] sensor coordinates
+        xs: Array of sensor x coordinates
+        ys: Array of sensor y coordinates
     
     Returns:
         float: Sum of distances from hub to all sensors
     """
-    total = 0
-    
-    for sensor in sensors:
-        dist = distance_between_points(hub, sensor)
-        total = total + dist
-    
-    return total
+    dx = xs - hub[0]
+    dy = ys - hub[1]
+    return float(np.sqrt(dx * dx + dy * dy).sum())
 
 
 def find_optimal_hub(sensor_locations):
@@ -151,11 +226,14 @@ def find_optimal_hub(sensor_locations):
     if len(sensor_locations) == 1:
         return 0.0
     
+    # Convert once to the internal structure-of-arrays representation
+    xs, ys = _to_soa(sensor_locations)
+    
     # Find optimal hub using Weiszfeld algorithm
-    optimal_hub = weiszfeld_optimization(sensor_locations)
+    optimal_hub = weiszfeld_optimization(xs, ys)
     
     # Calculate and return total distance
-    result = calculate_total_distance(optimal_hub, sensor_locations)
+    result = calculate_total_distance(optimal_hub, xs, ys)
     
     return round(result, 5)
 
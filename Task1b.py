@@ -9,6 +9,17 @@ with clear separation between different algorithm components.
 import random
 import math
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return lambda func: func
+
 
 # ============================================================================
 # CITY MANAGEMENT FUNCTIONS
@@ -34,23 +45,25 @@ def generate_cities(count, max_coord=100):
     return cities
 
 
-def distance_between(city_a, city_b):
+def build_distance_matrix(cities):
     """
-    Calculate Euclidean distance between two cities.
+    Precompute the pairwise Euclidean distances between all cities.
     
     Args:
-        city_a (list): [x, y] coordinates
-        city_b (list): [x, y] coordinates
+        cities (np.ndarray): (N, 2) array of city coordinates
     
     Returns:
-        float: Euclidean distance
+        np.ndarray: (N, N) matrix where entry [i, j] is the distance i -> j
     """
-    dx = city_a[0] - city_b[0]
-    dy = city_a[1] - city_b[1]
-    return math.sqrt(dx * dx + dy * dy)
+    coords = np.asarray(cities, dtype=np.float64)
+    xs = coords[:, 0]
+    ys = coords[:, 1]
+    dx = xs[:, None] - xs[None, :]
+    dy = ys[:, None] - ys[None, :]
+    return np.sqrt(dx * dx + dy * dy)
 
 
-def evaluate_tour_length(tour, cities):
+def evaluate_tour_length(tour, distances):
     """
     Calculate the total distance of a tour.
     
@@ -58,54 +71,65 @@ def evaluate_tour_length(tour, cities):
     
     Args:
         tour (list): Indices of cities in tour order
-        cities (list): City coordinates
+        distances (np.ndarray): (N, N) precomputed distance matrix
     
     Returns:
         float: Total tour distance
     """
-    total_distance = 0.0
-    tour_size = len(tour)
-    
-    for position in range(tour_size):
-        current_idx = tour[position]
-        next_idx = tour[(position + 1) % tour_size]
-        
-        segment_distance = distance_between(
-            cities[current_idx],
-            cities[next_idx]
-        )
-        total_distance += segment_distance
-    
-    return total_distance
+    # Pair every city with its successor (rolling wraps last -> first)
+    tour = np.asarray(tour)
+    return float(distances[tour, np.roll(tour, -1)].sum())
 
 
 # ============================================================================
 # NEIGHBORHOOD GENERATION
 # ============================================================================
 
-def generate_two_opt_neighbor(tour, segment_start, segment_end):
+@njit(cache=True)
+def apply_two_opt_move(tour, segment_start, segment_end):
     """
-    Generate a new tour by applying 2-opt move.
+    Apply a 2-opt move to the tour in place.
     
-    The 2-opt move reverses the segment between segment_start and segment_end.
-    This is computationally efficient and effective for TSP problems.
+    The 2-opt move reverses the segment between segment_start and segment_end
+    by swapping elements inwards, so no new tour is allocated.
     
     Example: [0,1,2,3,4] with start=1, end=3 becomes [0,3,2,1,4]
     
     Args:
-        tour (list): Current tour
+        tour (np.ndarray): Current tour, modified in place
+        segment_start (int): Start index of segment to reverse
+        segment_end (int): End index of segment to reverse
+    """
+    i = segment_start
+    j = segment_end
+    while i < j:
+        tour[i], tour[j] = tour[j], tour[i]
+        i += 1
+        j -= 1
+
+
+@njit(cache=True)
+def two_opt_delta(tour, segment_start, segment_end, distances):
+    """
+    Change in tour length caused by a 2-opt move, computed in O(1).
+    
+    Reversing tour[segment_start..segment_end] only replaces two edges:
+    (a, b) and (c, d) become (a, c) and (b, d).
+    
+    Args:
+        tour (np.ndarray): Current tour
         segment_start (int): Start index of segment to reverse
         segment_end (int): End index of segment to reverse
+        distances (np.ndarray): (N, N) precomputed distance matrix
     
     Returns:
-        list: New tour with segment reversed
+        float: Candidate distance minus current distance
     """
-    new_tour = (
-        tour[:segment_start] +
-        tour[segment_start:segment_end+1][::-1] +
-        tour[segment_end+1:]
-    )
-    return new_tour
+    a = tour[segment_start - 1]
+    b = tour[segment_start]
+    c = tour[segment_end]
+    d = tour[(segment_end + 1) % len(tour)]
+    return distances[a, c] + distances[b, d] - distances[a, b] - distances[c, d]
 
 
 # ============================================================================
@@ -151,29 +175,166 @@ def metropolis_acceptance(current_cost, candidate_cost, temperature):
     At high temperatures, worse solutions have higher chance of acceptance.
     At low temperatures, mostly better solutions are accepted.
     
+    The probability test is done in the log domain,
+    u < exp(-ΔE / T)  <=>  T * ln(u) < -ΔE,
+    which needs no exp call and no separate branch for T = 0.
+    The compiled kernel uses its own copy, _metropolis_accept.
+    
     Args:
         current_cost (float): Distance of current tour
         candidate_cost (float): Distance of candidate tour
-        temperature (float): Current temperature (must be > 0)
+        temperature (float): Current temperature (>= 0)
     
     Returns:
         bool: True if candidate should be accepted
     """
-    # Always accept improvements
-    if candidate_cost < current_cost:
-        return True
-    
-    # Calculate energy increase
     energy_increase = candidate_cost - current_cost
+    # 1 - random() lies in (0, 1], so the logarithm is always defined
+    return energy_increase < 0 or math.log(1.0 - random.random()) * temperature < -energy_increase
+
+
+@njit(fastmath=True, cache=True)
+def _fast_exp(x):
+    """
+    Approximate exp(x) for x <= 0 (absolute error below 2e-8).
     
-    # Calculate acceptance probability
-    if temperature > 0:
-        acceptance_prob = math.exp(-energy_increase / temperature)
-    else:
-        acceptance_prob = 0.0
+    Evaluates a degree-4 Taylor polynomial at x/64 and squares it six
+    times, which is much cheaper than a full exp for acceptance tests.
+    
+    Args:
+        x (float): Exponent, expected to be non-positive
+    
+    Returns:
+        float: Approximation of exp(x)
+    """
+    if x < -30.0:
+        return 0.0
+    y = x * (1.0 / 64.0)
+    p = 1.0 + y * (1.0 + y * (0.5 + y * (1.0 / 6.0 + y * (1.0 / 24.0))))
+    for _ in range(6):
+        p *= p
+    return p
+
+
+@njit(fastmath=True, cache=True)
+def _metropolis_accept(energy_increase, temperature):
+    """
+    Metropolis criterion for the compiled kernel (see metropolis_acceptance).
+    
+    Draws from Numba's seeded np.random stream and evaluates exp(-ΔE / T)
+    with _fast_exp.
+    
+    Args:
+        energy_increase (float): Candidate distance minus current distance
+        temperature (float): Current temperature (>= 0)
+    
+    Returns:
+        bool: True if candidate should be accepted
+    """
+    return energy_increase < 0.0 or (
+        temperature > 0.0 and np.random.random() < _fast_exp(-energy_increase / temperature)
+    )
+
+
+# ============================================================================
+# COMPILED ANNEALING KERNEL
+# ============================================================================
+
+@njit(fastmath=True, cache=True)
+def _sa_core(distances, temperatures, min_temperature, seed):
+    """
+    Run the full Simulated Annealing loop as compiled code.
+    
+    Temperatures are precomputed by the caller, so any cooling schedule
+    can drive the same kernel.
+    
+    Args:
+        distances (np.ndarray): (N, N) precomputed distance matrix
+        temperatures (np.ndarray): Temperature for each iteration
+        min_temperature (float): Stopping criterion
+        seed (int): Seed for the kernel's random number generator
+    
+    Returns:
+        tuple: (best_tour, best_distance, iterations_performed)
+    """
+    np.random.seed(seed)
+    n = distances.shape[0]
+    
+    # Initialize with random solution
+    current_tour = np.arange(n, dtype=np.int64)
+    np.random.shuffle(current_tour)
+    current_distance = 0.0
+    for position in range(n):
+        current_distance += distances[current_tour[position], current_tour[(position + 1) % n]]
+    
+    # Preallocated once; improvements copy into it instead of allocating
+    best_tour = np.empty(n, dtype=np.int64)
+    best_tour[:] = current_tour
+    best_distance = current_distance
+    iterations = 0
+    
+    for iteration in range(temperatures.shape[0]):
+        iterations = iteration + 1
+        temperature = temperatures[iteration]
+        
+        # Stop if cooled enough
+        if temperature < min_temperature:
+            break
+        
+        # Select random 2-opt move
+        idx1 = np.random.randint(0, n)
+        idx2 = np.random.randint(0, n)
+        if idx1 > idx2:
+            idx1, idx2 = idx2, idx1
+        
+        # Reversing the whole tour (or nothing) leaves the cycle unchanged
+        if idx1 == idx2 or (idx1 == 0 and idx2 == n - 1):
+            continue
+        
+        delta = two_opt_delta(current_tour, idx1, idx2, distances)
+        
+        if _metropolis_accept(delta, temperature):
+            apply_two_opt_move(current_tour, idx1, idx2)
+            current_distance += delta
+            
+            # Track best solution
+            if current_distance < best_distance:
+                best_tour[:] = current_tour
+                best_distance = current_distance
     
-    # Accept based on probability
-    return random.random() < acceptance_prob
+    return best_tour, best_distance, iterations
+
+
+@njit(parallel=True, cache=True)
+def _sa_ensemble(distances, temperatures, min_temperature, seeds):
+    """
+    Run independent annealing runs in parallel, one per row of temperatures.
+    
+    A single SA run is inherently serial, but separate runs (different
+    schedules or seeds) share nothing and parallelize across cores.
+    
+    Args:
+        distances (np.ndarray): (N, N) precomputed distance matrix
+        temperatures (np.ndarray): (R, I) temperatures, one row per run
+        min_temperature (float): Stopping criterion
+        seeds (np.ndarray): (R,) RNG seed for each run
+    
+    Returns:
+        tuple: (tours[R, N], distances[R], iterations[R])
+    """
+    runs = temperatures.shape[0]
+    n = distances.shape[0]
+    tours = np.empty((runs, n), dtype=np.int64)
+    costs = np.empty(runs, dtype=np.float64)
+    iterations = np.empty(runs, dtype=np.int64)
+    
+    for run in prange(runs):
+        tour, cost, iters = _sa_core(distances, temperatures[run], min_temperature, seeds[run])
+        tours[run] = tour
+        costs[run] = cost
+        iterations[run] = iters
+    
+    return tours, costs, iterations
 
 
 # ============================================================================
@@ -185,76 +346,109 @@ class TSPSimulatedAnnealingSolver:
     
     def __init__(self, cities):
         self.cities = cities
+        self.distance_matrix = build_distance_matrix(cities)
         self.num_cities = len(cities)
         self.iterations_performed = 0
         self.best_route = None
         self.best_cost = float('inf')
     
-    def solve(self, cooling_schedule, max_iterations=5000, min_temperature=1e-8):
+    def solve(self, cooling_schedule, max_iterations=5000, min_temperature=1e-8, seed=None):
         """
         Execute the Simulated Annealing algorithm.
         
         Algorithm steps:
         1. Start with random tour
-        2. Generate neighbor using 2-opt move
-        3. Accept/reject using Metropolis criterion
+        2. Propose a 2-opt move and evaluate its cost change in O(1)
+        3. Accept/reject using Metropolis criterion (apply move in place)
         4. Cool temperature according to schedule
         5. Repeat until convergence or max iterations
         
+        The loop itself runs in the compiled _sa_core kernel; this method
+        only prepares its inputs and records the results.
+        
         Args:
             cooling_schedule: Schedule object with temperature_at_iteration method
             max_iterations (int): Maximum iterations
             min_temperature (float): Stopping criterion
+            seed (int): Kernel RNG seed; drawn from `random` when None, so
+                seeding `random` keeps runs reproducible
         
         Returns:
             tuple: (best_tour, best_distance)
         """
-        # Initialize with random solution
-        current_tour = list(range(self.num_cities))
-        random.shuffle(current_tour)
-        current_distance = evaluate_tour_length(current_tour, self.cities)
+        if seed is None:
+            seed = random.randrange(2 ** 32)
         
-        best_tour = current_tour[:]
-        best_distance = current_distance
+        temperatures = self._temperature_table(cooling_schedule, max_iterations)
         
-        # Optimization loop
-        for iteration in range(max_iterations):
-            # Get temperature for this iteration
-            temperature = cooling_schedule.temperature_at_iteration(iteration)
-            
-            # Stop if cooled enough
-            if temperature < min_temperature:
-                break
-            
-            # Select random 2-opt move
-            idx1 = random.randint(0, self.num_cities - 1)
-            idx2 = random.randint(0, self.num_cities - 1)
-            
-            if idx1 > idx2:
-                idx1, idx2 = idx2, idx1
-            
-            if idx1 == idx2:
-                continue
-            
-            # Generate and evaluate neighbor
-            neighbor_tour = generate_two_opt_neighbor(current_tour, idx1, idx2)
-            neighbor_distance = evaluate_tour_length(neighbor_tour, self.cities)
-            
-            # Make acceptance decision
-            if metropolis_acceptance(current_distance, neighbor_distance, temperature):
-                current_tour = neighbor_tour
-                current_distance = neighbor_distance
-                
-                # Track best solution
-                if current_distance < best_distance:
-                    best_tour = current_tour[:]
-                    best_distance = current_distance
+        best_tour, best_distance, iterations = _sa_core(
+            self.distance_matrix, temperatures, min_temperature, seed
+        )
+        
+        # Re-sum the best tour once to drop accumulated rounding from deltas
+        best_distance = evaluate_tour_length(best_tour, self.distance_matrix)
         
         self.best_route = best_tour
         self.best_cost = best_distance
-        self.iterations_performed = iteration + 1
+        self.iterations_performed = iterations
         
         return best_tour, best_distance
+    
+    def solve_ensemble(self, cooling_schedules, restarts=4, max_iterations=5000,
+                       min_temperature=1e-8, seed=None):
+        """
+        Run seeded restarts of several cooling schedules in parallel.
+        
+        Every (schedule, restart) pair is an independent SA run executed by
+        the parallel _sa_ensemble kernel; the best run of each schedule is kept.
+        
+        Args:
+            cooling_schedules (list): Schedule objects to compare
+            restarts (int): Independent runs per schedule
+            max_iterations (int): Maximum iterations per run
+            min_temperature (float): Stopping criterion
+            seed (int): Base RNG seed; drawn from `random` when None
+        
+        Returns:
+            list: (best_tour, best_distance, iterations) for each schedule
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32 - len(cooling_schedules) * restarts)
+        
+        temperatures = np.repeat(
+            np.stack([self._temperature_table(schedule, max_iterations)
+                      for schedule in cooling_schedules]),
+            restarts,
+            axis=0
+        )
+        seeds = seed + np.arange(temperatures.shape[0], dtype=np.int64)
+        
+        tours, _, iterations = _sa_ensemble(
+            self.distance_matrix, temperatures, min_temperature, seeds
+        )
+        
+        results = []
+        for index in range(len(cooling_schedules)):
+            # Pick the best restart for this schedule, re-summing exactly
+            run_slice = range(index * restarts, (index + 1) * restarts)
+            run_costs = {run: evaluate_tour_length(tours[run], self.distance_matrix) for run in run_slice}
+            best_run = min(run_costs, key=run_costs.get)
+            results.append((tours[best_run].copy(), run_costs[best_run], int(iterations[best_run])))
+        
+        best_tour, best_distance, iterations_performed = min(results, key=lambda result: result[1])
+        self.best_route = best_tour
+        self.best_cost = best_distance
+        self.iterations_performed = iterations_performed
+        
+        return results
+    
+    @staticmethod
+    def _temperature_table(cooling_schedule, max_iterations):
+        """Precompute the temperature for every iteration of a schedule."""
+        return np.array(
+            [cooling_schedule.temperature_at_iteration(k) for k in range(max_iterations)],
+            dtype=np.float64
+        )
 
 
 # ============================================================================
@@ -269,37 +463,38 @@ if __name__ == "__main__":
     # Setup
     random.seed(42)
     NUM_CITIES = 30
-    cities = generate_cities(NUM_CITIES, max_coord=100)
+    cities = np.asarray(generate_cities(NUM_CITIES, max_coord=100), dtype=np.float64)
     
     print(f"\nProblem Configuration:")
     print(f"  - Number of cities: {NUM_CITIES}")
     print(f"  - Grid size: 100x100")
     
+    # Both schedules (with seeded restarts) run concurrently in one ensemble
+    RESTARTS = 4
+    print(f"  - Restarts per schedule: {RESTARTS} (run in parallel)")
+    
+    schedule_exp = ExponentialSchedule(initial=1000.0, rate=0.9995)
+    schedule_lin = LinearSchedule(initial=1000.0, decrement=0.2)
+    solver = TSPSimulatedAnnealingSolver(cities)
+    (tour_exp, dist_exp, iters_exp), (tour_lin, dist_lin, iters_lin) = solver.solve_ensemble(
+        [schedule_exp, schedule_lin], restarts=RESTARTS
+    )
+    
     # Experiment 1: Exponential cooling
     print("\n" + "-" * 70)
     print("EXPERIMENT 1: Exponential Cooling Schedule")
     print("-" * 70)
     print("Temperature formula: T = 1000 × 0.9995^k")
-    
-    schedule_exp = ExponentialSchedule(initial=1000.0, rate=0.9995)
-    solver_exp = TSPSimulatedAnnealingSolver(cities)
-    tour_exp, dist_exp = solver_exp.solve(schedule_exp)
-    
     print(f"Final tour distance: {dist_exp:.2f}")
-    print(f"Iterations executed: {solver_exp.iterations_performed}")
+    print(f"Iterations executed: {iters_exp}")
     
     # Experiment 2: Linear cooling
     print("\n" + "-" * 70)
     print("EXPERIMENT 2: Linear Cooling Schedule")
     print("-" * 70)
     print("Temperature formula: T = 1000 - 0.2×k")
-    
-    schedule_lin = LinearSchedule(initial=1000.0, decrement=0.2)
-    solver_lin = TSPSimulatedAnnealingSolver(cities)
-    tour_lin, dist_lin = solver_lin.solve(schedule_lin)
-    
     print(f"Final tour distance: {dist_lin:.2f}")
-    print(f"Iterations executed: {solver_lin.iterations_performed}")
+    print(f"Iterations executed: {iters_lin}")
     
     # Comparison and analysis
     print("\n" + "-" * 70)
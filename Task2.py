@@ -6,6 +6,15 @@ This solution uses separate utility functions for initialization,
 computation, and result extraction to improve readability.
 """
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the DP then runs as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return lambda func: func
+
 
 def prepare_tile_array(multipliers):
     """
@@ -18,9 +27,13 @@ def prepare_tile_array(multipliers):
         multipliers (list): Original tile multiplier values
     
     Returns:
-        list: Modified array with boundaries [1] + multipliers + [1]
+        np.ndarray: int64 array with boundaries [1] + multipliers + [1]
     """
-    return [1] + multipliers + [1]
+    tiles = np.empty(len(multipliers) + 2, dtype=np.int64)
+    tiles[0] = 1
+    tiles[-1] = 1
+    tiles[1:-1] = multipliers
+    return tiles
 
 
 def initialize_dp_table(size):
@@ -31,44 +44,42 @@ def initialize_dp_table(size):
         size (int): Size of the tile array (including boundaries)
     
     Returns:
-        list: 2D list initialized with zeros
+        np.ndarray: (size, size) int64 array initialized with zeros
     """
-    return [[0] * size for _ in range(size)]
+    return np.zeros((size, size), dtype=np.int64)
 
 
-def calculate_points_for_configuration(tiles, dp, left_bound, right_bound, last_shatter_idx):
+@njit(cache=True, boundscheck=False)
+def _fill(tiles, dp, n):
     """
-    Calculate total points if tile at last_shatter_idx is shattered last
-    in the range between left_bound and right_bound.
+    Compiled bottom-up DP fill over int64 arrays.
     
-    When tile at last_shatter_idx is shattered last:
-    - Its immediate neighbors are tiles[left_bound] and tiles[right_bound]
-    - Points for this action = tiles[left_bound] * tiles[last_shatter_idx] * tiles[right_bound]
-    - Plus all points from the left subrange and right subrange
+    Shattering tile k last in (left, right) scores
+    dp[left][k] + dp[k][right] + tiles[left] * tiles[k] * tiles[right].
+    The loop-invariant tiles[left] * tiles[right] product and the dp[left]
+    row are hoisted out of the innermost loop, and dp[left, right] is
+    written once per range.
     
     Args:
-        tiles (list): Array of tile multipliers with boundaries
-        dp (list): DP table with previously computed results
-        left_bound (int): Left boundary of the current range
-        right_bound (int): Right boundary of the current range
-        last_shatter_idx (int): Index of tile to shatter last
-    
-    Returns:
-        int: Total points from this configuration
+        tiles (np.ndarray): Array of tile multipliers with boundaries
+        dp (np.ndarray): DP table to be filled
+        n (int): Number of tiles including boundaries
     """
-    # Get points already computed for left side
-    left_subrange_points = dp[left_bound][last_shatter_idx]
-    
-    # Get points already computed for right side
-    right_subrange_points = dp[last_shatter_idx][right_bound]
-    
-    # Calculate points for shattering this tile last
-    shattering_this_tile = tiles[left_bound] * tiles[last_shatter_idx] * tiles[right_bound]
-    
-    # Sum all components
-    total = left_subrange_points + right_subrange_points + shattering_this_tile
-    
-    return total
+    for range_len in range(2, n):
+        for left_idx in range(n - range_len):
+            right_idx = left_idx + range_len
+            
+            # Loop-invariant in middle_idx: boundary product and DP row
+            lr = tiles[left_idx] * tiles[right_idx]
+            dp_l = dp[left_idx]
+            best = dp_l[right_idx]
+            
+            for middle_idx in range(left_idx + 1, right_idx):
+                cand = dp_l[middle_idx] + dp[middle_idx, right_idx] + lr * tiles[middle_idx]
+                if cand > best:
+                    best = cand
+            
+            dp_l[right_idx] = best
 
 
 def fill_dp_table(tiles, dp):
@@ -77,29 +88,13 @@ def fill_dp_table(tiles, dp):
     
     Build solution from smaller subproblems to larger ones.
     For each range, find the best tile to shatter last.
+    The triple loop runs in the Numba-compiled _fill kernel.
     
     Args:
-        tiles (list): Array of tile multipliers with boundaries
-        dp (list): DP table to be filled
+        tiles (np.ndarray): Array of tile multipliers with boundaries
+        dp (np.ndarray): DP table to be filled
     """
-    n = len(tiles)
-    
-    # Iterate by range length (distance between left and right indices)
-    for range_len in range(2, n):
-        # For each valid left index
-        for left_idx in range(n - range_len):
-            # Calculate right index
-            right_idx = left_idx + range_len
-            
-            # Try each possible tile to shatter last
-            for middle_idx in range(left_idx + 1, right_idx):
-                # Get points for this configuration
-                candidate_points = calculate_points_for_configuration(
-                    tiles, dp, left_idx, right_idx, middle_idx
-                )
-                
-                # Keep the maximum
-                dp[left_idx][right_idx] = max(dp[left_idx][right_idx], candidate_points)
+    _fill(tiles, dp, len(tiles))
 
 
 def extract_result(dp):
@@ -109,13 +104,13 @@ def extract_result(dp):
     The answer is at dp[0][n-1] where 0 and n-1 are the boundaries.
     
     Args:
-        dp (list): Completed DP table
+        dp (np.ndarray): Completed DP table
     
     Returns:
         int: Maximum points achievable
     """
     n = len(dp)
-    return dp[0][n - 1]
+    return int(dp[0][n - 1])
 
 
 def max_shatter_points(tile_multipliers):
@@ -5,7 +5,9 @@ Provides a ServiceCenterPlanner class that encapsulates the greedy DFS logic.
 This version structures code for clarity and testability.
 """
 
-from typing import Optional, List
+from array import array
+from collections import deque
+from typing import Optional, List, Tuple
 
 
 class TreeNode:
@@ -16,6 +18,36 @@ class TreeNode:
         self.right = right
 
 
+def flatten_tree(root: Optional[TreeNode]) -> Tuple[array, array]:
+    """
+    Flatten a tree into parallel int32 child arrays (structure-of-arrays).
+
+    Nodes get contiguous ids in BFS order, so every child id is larger than
+    its parent's id. left[i] / right[i] hold child ids, or -1 if absent.
+    """
+    left = array('i')
+    right = array('i')
+    if root is None:
+        return left, right
+
+    order = [root]
+    i = 0
+    while i < len(order):
+        node = order[i]
+        if node.left is not None:
+            left.append(len(order))
+            order.append(node.left)
+        else:
+            left.append(-1)
+        if node.right is not None:
+            right.append(len(order))
+            order.append(node.right)
+        else:
+            right.append(-1)
+        i += 1
+    return left, right
+
+
 class ServiceCenterPlanner:
     """
     Planner that determines the minimum number of service centers using
@@ -34,32 +66,46 @@ class ServiceCenterPlanner:
     def __init__(self):
         self.service_centers_count = 0
 
-    def _dfs_state(self, node: Optional[TreeNode]) -> int:
+    def _sweep_states(self, left: array, right: array) -> int:
         """
-        Post-order traversal returning the state of `node`.
+        Resolve every node's state over the flattened child arrays.
 
         Logic:
         - If either child is NOT_COVERED -> place center here (HAS_CENTER)
         - Else if either child HAS_CENTER -> this node is COVERED
         - Else -> this node is NOT_COVERED
-        """
-        if node is None:
-            return ServiceCenterPlanner.COVERED
 
-        left_child_state = self._dfs_state(node.left)
-        right_child_state = self._dfs_state(node.right)
-
-        # If a child is not covered, we must put a center here
-        if left_child_state == ServiceCenterPlanner.NOT_COVERED or right_child_state == ServiceCenterPlanner.NOT_COVERED:
-            self.service_centers_count += 1
-            return ServiceCenterPlanner.HAS_CENTER
-
-        # If any child has a center, current node is covered
-        if left_child_state == ServiceCenterPlanner.HAS_CENTER or right_child_state == ServiceCenterPlanner.HAS_CENTER:
-            return ServiceCenterPlanner.COVERED
-
-        # Otherwise node is not yet covered
-        return ServiceCenterPlanner.NOT_COVERED
+        Ids are swept in reverse BFS order, so both children are resolved
+        before their parent with a linear pass over contiguous arrays.
+        Returns the state of the root (id 0).
+        """
+        NOT_COVERED = ServiceCenterPlanner.NOT_COVERED
+        HAS_CENTER = ServiceCenterPlanner.HAS_CENTER
+        COVERED = ServiceCenterPlanner.COVERED
+
+        n = len(left)
+        if n == 0:
+            return COVERED
+
+        state = array('i', [COVERED]) * n
+        for i in range(n - 1, -1, -1):
+            left_id = left[i]
+            right_id = right[i]
+            left_child_state = state[left_id] if left_id >= 0 else COVERED
+            right_child_state = state[right_id] if right_id >= 0 else COVERED
+
+            # If a child is not covered, we must put a center here
+            if left_child_state == NOT_COVERED or right_child_state == NOT_COVERED:
+                self.service_centers_count += 1
+                state[i] = HAS_CENTER
+            # If any child has a center, current node is covered
+            elif left_child_state == HAS_CENTER or right_child_state == HAS_CENTER:
+                state[i] = COVERED
+            # Otherwise node is not yet covered
+            else:
+                state[i] = NOT_COVERED
+
+        return state[0]
 
     def min_centers(self, root: Optional[TreeNode]) -> int:
         """
@@ -67,7 +113,8 @@ class ServiceCenterPlanner:
         Ensures the root is covered (extra center added if needed).
         """
         self.service_centers_count = 0
-        root_state = self._dfs_state(root)
+        left, right = flatten_tree(root)
+        root_state = self._sweep_states(left, right)
         if root_state == ServiceCenterPlanner.NOT_COVERED:
             self.service_centers_count += 1
         return self.service_centers_count
@@ -80,14 +127,14 @@ def build_tree_from_level(values: List[Optional[int]]) -> Optional[TreeNode]:
     if not values:
         return None
     nodes = [TreeNode(v) if v is not None else None for v in values]
-    kids = nodes[::-1]
-    root = kids.pop()
+    kids = deque(nodes)
+    root = kids.popleft()
     for node in nodes:
         if node:
             if kids:
-                node.left = kids.pop()
+                node.left = kids.popleft()
             if kids:
-                node.right = kids.pop()
+                node.right = kids.popleft()
     return root
 
 
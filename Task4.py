@@ -6,147 +6,216 @@ This implementation uses greedy allocation: prioritize Solar, then Hydro, then D
 Handles hourly constraints and validates source availability times.
 """
 
-def allocate_energy_greedy():
-    """
-    Main greedy allocation function for energy distribution across districts.
-    Returns allocation results, cost tracking, and utilization metrics.
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the core then runs as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return lambda func: func
+
+
+# Energy demand by hour and district (kWh), keyed by hour in ascending order
+HOURLY_DEMAND = {
+    6: {"A": 20, "B": 15, "C": 25},
+    7: {"A": 22, "B": 16, "C": 28},
+    8: {"A": 25, "B": 18, "C": 30},
+    12: {"A": 28, "B": 20, "C": 32},
+    18: {"A": 30, "B": 22, "C": 35},
+    19: {"A": 35, "B": 25, "C": 40},
+    20: {"A": 32, "B": 24, "C": 38},
+    23: {"A": 26, "B": 19, "C": 28},
+}
+
+# Energy sources with specifications
+# (name, capacity, start_hour, end_hour, cost_per_kwh)
+ENERGY_SOURCES = [
+    ("Solar", 50, 6, 18, 1.0),
+    ("Hydro", 40, 0, 24, 1.5),
+    ("Diesel", 60, 17, 23, 3.0),
+]
+
+DISTRICTS = ["A", "B", "C"]
+
+
+@njit(fastmath=True, cache=True)
+def _allocate_core(demand, totals, src_cap, available, cost_order):
     """
+    Compiled greedy allocation over the demand matrix and source arrays.
     
-    # Energy demand by hour and district (kWh)
-    hourly_demand = {
-        "06": {"A": 20, "B": 15, "C": 25},
-        "07": {"A": 22, "B": 16, "C": 28},
-        "08": {"A": 25, "B": 18, "C": 30},
-        "12": {"A": 28, "B": 20, "C": 32},
-        "18": {"A": 30, "B": 22, "C": 35},
-        "19": {"A": 35, "B": 25, "C": 40},
-        "20": {"A": 32, "B": 24, "C": 38},
-        "23": {"A": 26, "B": 19, "C": 28},
-    }
+    Args:
+        demand: (H, D) demand per hour and district
+        totals: (H,) total demand per hour
+        src_cap: (S,) source capacity
+        available: (S, H) precomputed source availability per hour
+        cost_order: Source indices sorted cheapest first
     
-    # Energy sources with specifications
-    # (name, capacity, start_hour, end_hour, cost_per_kwh)
-    energy_sources = [
-        ("Solar", 50, 6, 18, 1.0),
-        ("Hydro", 40, 0, 24, 1.5),
-        ("Diesel", 60, 17, 23, 3.0),
-    ]
+    Returns:
+        tuple: (breakdown[S, H, D], drawn[S, H], hour_used[H])
+    """
+    num_sources = src_cap.shape[0]
+    num_hours, num_districts = demand.shape
     
-    districts = ["A", "B", "C"]
-    allocation_log = []
-    total_cost = 0.0
-    total_energy_used = 0.0
-    renewable_energy = 0.0
-    diesel_usage_log = []
-    
-    # Process each hour
-    for hour_str in sorted(hourly_demand.keys()):
-        hour = int(hour_str)
-        hour_allocation = {"hour": hour_str, "districts": {}}
-        hour_demand = hourly_demand[hour_str]
-        
-        # Calculate total demand for this hour
-        total_hour_demand = sum(hour_demand.values())
-        hour_cost = 0.0
-        hour_energy_used = 0.0
-        
-        # Available sources for this hour (in priority order: cheapest first)
-        available_sources = []
-        for source_name, capacity, start_h, end_h, cost in energy_sources:
-            # Validate source availability
-            if start_h <= hour < end_h:
-                available_sources.append((source_name, capacity, cost))
-        
-        # Sort by cost (greedy: cheapest first)
-        available_sources.sort(key=lambda x: x[2])
-        
-        # Allocate energy to districts
-        remaining_demand = total_hour_demand
-        district_allocation = {d: 0 for d in districts}
-        source_breakdown = {d: {} for d in districts}
+    breakdown = np.zeros((num_sources, num_hours, num_districts))
+    drawn = np.zeros((num_sources, num_hours), dtype=np.bool_)
+    used = np.zeros((num_hours, num_districts))
+    hour_used = np.zeros(num_hours)
+    
+    for h in range(num_hours):
+        total = totals[h]
+        remaining_demand = total
         
-        # Greedy allocation: use sources in cost order
-        for source_name, capacity, cost in available_sources:
-            source_used = 0
+        # Greedy allocation: use sources in cost order, stopping once the
+        # hour's demand is met (costlier sources are then never touched)
+        for s in cost_order:
+            if remaining_demand <= 0.01:
+                break
+            if not available[s, h]:
+                continue
+            drawn[s, h] = True
             
             # Distribute from this source proportionally to districts
-            for district in districts:
+            source_used = 0.0
+            for d in range(num_districts):
                 if remaining_demand <= 0.01:
                     break
-                
-                district_proportion = hour_demand[district] / total_hour_demand if total_hour_demand > 0 else 0
-                allocation_for_district = min(
-                    district_proportion * capacity,
-                    hour_demand[district] - district_allocation[district]
-                )
-                
-                district_allocation[district] += allocation_for_district
-                source_used += allocation_for_district
-                
-                if source_name not in source_breakdown[district]:
-                    source_breakdown[district][source_name] = 0
-                source_breakdown[district][source_name] += allocation_for_district
-            
-            remaining_demand -= source_used
-            hour_energy_used += source_used
-            hour_cost += source_used * cost
+                proportion = demand[h, d] / total if total > 0 else 0.0
+                allocation = min(proportion * src_cap[s], demand[h, d] - used[h, d])
+                used[h, d] += allocation
+                breakdown[s, h, d] = allocation
+                source_used += allocation
+                remaining_demand -= allocation
             
-            # Track renewable energy
-            if source_name in ["Solar", "Hydro"]:
-                renewable_energy += source_used
-            elif source_name == "Diesel":
-                diesel_usage_log.append({
-                    "hour": hour,
-                    "amount": source_used,
-                    "reason": "Peak demand or insufficient renewables"
-                })
-        
-        # Demand met percentage with ±10% flexibility
-        demand_met_pct = (hour_energy_used / total_hour_demand * 100) if total_hour_demand > 0 else 0
-        flexibility_lower = 90.0
-        flexibility_upper = 110.0
-        is_demand_satisfied = flexibility_lower <= demand_met_pct <= flexibility_upper
-        
-        # Record allocation
-        for district in districts:
+            hour_used[h] += source_used
+    
+    return breakdown, drawn, hour_used
+
+
+def allocate_energy_greedy(hourly_demand=HOURLY_DEMAND, energy_sources=ENERGY_SOURCES,
+                           districts=DISTRICTS):
+    """
+    Main greedy allocation function for energy distribution across districts.
+    Returns allocation results, cost tracking, and utilization metrics.
+    
+    Demand and source specifications are laid out as structure-of-arrays
+    NumPy data and the allocation loop runs in the compiled _allocate_core;
+    only report assembly happens in Python. The inputs default to the
+    module-level data, which is never modified. hourly_demand is keyed by
+    integer hour and iterated in insertion order, so it must be ascending.
+    """
+    
+    # Demand matrix: one row per hour, one column per district
+    hour_keys = list(hourly_demand)
+    hours = np.array(hour_keys, dtype=np.int64)
+    demand = np.array(
+        [[hour_demand[d] for d in districts] for hour_demand in hourly_demand.values()],
+        dtype=np.float64
+    )
+    totals = demand.sum(axis=1)
+    
+    # Source specifications as parallel arrays
+    src_names = [source[0] for source in energy_sources]
+    src_cap = np.array([source[1] for source in energy_sources], dtype=np.float64)
+    src_start = np.array([source[2] for source in energy_sources], dtype=np.int64)
+    src_end = np.array([source[3] for source in energy_sources], dtype=np.int64)
+    src_cost = np.array([source[4] for source in energy_sources], dtype=np.float64)
+    src_renewable = np.array([name in ["Solar", "Hydro"] for name in src_names])
+    src_diesel = np.array([name == "Diesel" for name in src_names])
+    
+    # Validate source availability for every (source, hour) pair once,
+    # instead of rescanning the source list inside the allocation loop
+    available = (hours[None, :] >= src_start[:, None]) & (hours[None, :] < src_end[:, None])
+    
+    # Greedy: cheapest first (stable, so equal costs keep list order)
+    cost_order = np.argsort(src_cost, kind="stable")
+    
+    breakdown, drawn, hour_energy_used = _allocate_core(
+        demand, totals, src_cap, available, cost_order
+    )
+    
+    # Aggregates fall out of the dense [S, H, D] breakdown by reduction
+    used = breakdown.sum(axis=0)
+    source_hour = breakdown.sum(axis=2)
+    hour_cost = src_cost @ source_hour
+    diesel = source_hour[src_diesel].sum(axis=0)
+    renewable_energy = source_hour[src_renewable].sum()
+    total_cost = hour_cost.sum()
+    total_energy_used = hour_energy_used.sum()
+    
+    diesel_usage_log = [
+        {
+            "hour": hour_keys[h],
+            "amount": float(diesel[h]),
+            "reason": "Peak demand or insufficient renewables"
+        }
+        for h in range(len(hour_keys))
+        if (drawn[:, h] & src_diesel).any()
+    ]
+    
+    # Demand met percentage with ±10% flexibility
+    demand_met_pct = np.divide(
+        hour_energy_used * 100, totals,
+        out=np.zeros_like(totals), where=totals > 0
+    )
+    flexibility_lower = 90.0
+    flexibility_upper = 110.0
+    is_demand_satisfied = (demand_met_pct >= flexibility_lower) & (demand_met_pct <= flexibility_upper)
+    
+    allocated_rounded = np.round(used, 2).tolist()
+    breakdown_list = breakdown.tolist()
+    
+    # Record allocation
+    allocation_log = []
+    for h, (hour, hour_demand) in enumerate(hourly_demand.items()):
+        hour_allocation = {"hour": hour, "districts": {}}
+        # Sources drawn this hour, resolved once and shared by every district
+        hour_sources = [(src_names[s], breakdown_list[s][h]) for s in cost_order if drawn[s, h]]
+        for d, district in enumerate(districts):
             hour_allocation["districts"][district] = {
-                "allocated": round(district_allocation[district], 2),
+                "allocated": allocated_rounded[h][d],
                 "demand": hour_demand[district],
-                "sources": source_breakdown[district]
+                "sources": {name: amounts[d] for name, amounts in hour_sources}
             }
         
-        hour_allocation["total_used"] = round(hour_energy_used, 2)
-        hour_allocation["total_demand"] = total_hour_demand
-        hour_allocation["demand_met_pct"] = round(demand_met_pct, 1)
-        hour_allocation["satisfied"] = is_demand_satisfied
-        hour_allocation["cost"] = round(hour_cost, 2)
+        hour_allocation["total_used"] = round(float(hour_energy_used[h]), 2)
+        hour_allocation["total_demand"] = sum(hour_demand.values())
+        hour_allocation["demand_met_pct"] = round(float(demand_met_pct[h]), 1)
+        hour_allocation["satisfied"] = bool(is_demand_satisfied[h])
+        hour_allocation["cost"] = round(float(hour_cost[h]), 2)
         
         allocation_log.append(hour_allocation)
-        total_cost += hour_cost
-        total_energy_used += hour_energy_used
     
     return {
         "allocations": allocation_log,
-        "total_cost_rs": round(total_cost, 2),
-        "total_energy_kwh": round(total_energy_used, 2),
-        "renewable_percentage": round((renewable_energy / total_energy_used * 100) if total_energy_used > 0 else 0, 1),
+        "total_cost_rs": round(float(total_cost), 2),
+        "total_energy_kwh": round(float(total_energy_used), 2),
+        "source_totals_kwh": {name: round(float(total), 2) for name, total in zip(src_names, source_hour.sum(axis=1))},
+        "renewable_percentage": round(float(renewable_energy / total_energy_used * 100) if total_energy_used > 0 else 0, 1),
         "diesel_usage_log": diesel_usage_log
     }
 
 
 def print_results_table(results):
-    """Print formatted results table."""
-    print("\n" + "="*100)
-    print("SMART ENERGY GRID LOAD DISTRIBUTION - HOURLY ALLOCATION REPORT")
-    print("="*100)
-    print(f"{'Hour':<6} {'District':<10} {'Solar':<8} {'Hydro':<8} {'Diesel':<8} {'Total Used':<12} {'Demand':<10} {'% Met':<8} {'Status':<12}")
-    print("-"*100)
+    """Print formatted results table (built in memory, written once)."""
+    row_fmt = "{:<6} {:<10} {:<8.1f} {:<8.1f} {:<8.1f} {:<12.2f} {:<10.0f}".format
+    first_row_fmt = "{:<6} {:<10} {:<8.1f} {:<8.1f} {:<8.1f} {:<12.2f} {:<10.0f} {:<8.1f} {:<12}".format
+    
+    lines = [
+        "\n" + "="*100,
+        "SMART ENERGY GRID LOAD DISTRIBUTION - HOURLY ALLOCATION REPORT",
+        "="*100,
+        f"{'Hour':<6} {'District':<10} {'Solar':<8} {'Hydro':<8} {'Diesel':<8} {'Total Used':<12} {'Demand':<10} {'% Met':<8} {'Status':<12}",
+        "-"*100,
+    ]
     
     for allocation in results["allocations"]:
         hour = allocation["hour"]
         districts_data = allocation["districts"]
         
-        for i, district in enumerate(["A", "B", "C"]):
+        for i, district in enumerate(DISTRICTS):
             data = districts_data[district]
             sources = data["sources"]
             solar = sources.get("Solar", 0)
@@ -157,11 +226,13 @@ def print_results_table(results):
             
             if i == 0:
                 status = "✓ OK" if allocation["satisfied"] else "✗ UNMET"
-                print(f"{hour:<6} {district:<10} {solar:<8.1f} {hydro:<8.1f} {diesel:<8.1f} {total_used:<12.2f} {demand:<10.0f} {allocation['demand_met_pct']:<8.1f} {status:<12}")
+                lines.append(first_row_fmt(f"{hour:02d}", district, solar, hydro, diesel, total_used, demand,
+                                           allocation['demand_met_pct'], status))
             else:
-                print(f"{'':6} {district:<10} {solar:<8.1f} {hydro:<8.1f} {diesel:<8.1f} {total_used:<12.2f} {demand:<10.0f}")
+                lines.append(row_fmt("", district, solar, hydro, diesel, total_used, demand))
     
-    print("="*100)
+    lines.append("="*100)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_analysis_report(results):
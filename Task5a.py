@@ -7,7 +7,23 @@ Modular class design with clear responsibility separation.
 import tkinter as tk
 from tkinter import messagebox, ttk, simpledialog
 import networkx as nx
+import numpy as np
 import math
+from functools import lru_cache
+from itertools import islice
+
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:  # Pillow is optional; the canvas then draws one item per shape
+    PIL_AVAILABLE = False
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; coloring then runs as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return lambda func: func
 
 
 class NetworkGraph:
@@ -17,6 +33,9 @@ class NetworkGraph:
         self.graph = nx.Graph()
         self.mst_edges = []
         self.disabled_nodes = set()
+        # Cached results for the static graph; cleared by _invalidate()
+        self._mst_cache = None
+        self._pos_cache = None
         self._build_graph()
     
     def _build_graph(self):
@@ -28,25 +47,58 @@ class NetworkGraph:
         ]
         for u, v, w in edges:
             self.graph.add_edge(u, v, weight=w)
+        # Kruskal order, sorted once for the fixed topology
+        self._sorted_edges = sorted(edges, key=lambda e: e[2])
+    
+    def _invalidate(self):
+        """Drop cached MST/layout results after the network changes."""
+        self._mst_cache = None
+        self._pos_cache = None
     
     def compute_mst(self):
-        """Compute MST using Kruskal's algorithm."""
-        mst = nx.minimum_spanning_tree(self.graph, algorithm='kruskal')
-        self.mst_edges = list(mst.edges())
-        total_weight = sum(self.graph[u][v]['weight'] for u, v in self.mst_edges)
-        return self.mst_edges, total_weight
+        """
+        Compute MST using Kruskal's algorithm (cached until the graph changes).
+        
+        Union-find over the pre-sorted edge list; edges touching a disabled
+        node are skipped, giving a spanning forest of the surviving network.
+        """
+        if self._mst_cache is None:
+            parent = {node: node for node in self.graph.nodes()}
+            
+            def find(x):
+                while parent[x] != x:
+                    parent[x] = parent[parent[x]]
+                    x = parent[x]
+                return x
+            
+            disabled = self.disabled_nodes
+            self.mst_edges = []
+            total_weight = 0
+            for u, v, w in self._sorted_edges:
+                if u in disabled or v in disabled:
+                    continue
+                ru, rv = find(u), find(v)
+                if ru != rv:
+                    parent[ru] = rv
+                    self.mst_edges.append((u, v))
+                    total_weight += w
+            self._mst_cache = (self.mst_edges, total_weight)
+        return self._mst_cache
     
     def get_nodes(self):
         return list(self.graph.nodes())
     
     def get_node_positions(self):
-        """Get node positions for visualization."""
-        return nx.spring_layout(self.graph, seed=42)
+        """Get node positions for visualization (cached spring layout)."""
+        if self._pos_cache is None:
+            self._pos_cache = nx.spring_layout(self.graph, seed=42)
+        return self._pos_cache
     
     def disable_node(self, node_id):
         """Mark node as disabled (offline)."""
         if node_id in self.graph.nodes():
             self.disabled_nodes.add(node_id)
+            self._invalidate()
             return True
         return False
     
@@ -57,34 +109,68 @@ class NetworkGraph:
 class PathFinder:
     """Handles path finding algorithms."""
     
-    def __init__(self, graph):
+    def __init__(self, graph, disabled_nodes=None):
         self.graph = graph
+        # Live view of the network's disabled set; routes avoid these nodes
+        self.disabled_nodes = disabled_nodes if disabled_nodes is not None else set()
+        # Per-instance memo keyed on (source, target, disabled_key), so a node
+        # failure naturally misses the cache instead of returning stale routes
+        self._disjoint_cached = lru_cache(maxsize=256)(self._find_disjoint_paths)
+        self._shortest_cached = lru_cache(maxsize=256)(self._get_shortest_path)
+    
+    def _disabled_key(self):
+        return tuple(sorted(self.disabled_nodes))
+    
+    def _active_graph(self, disabled_key):
+        """Zero-copy view of the graph with disabled nodes hidden."""
+        if not disabled_key:
+            return self.graph
+        return nx.restricted_view(self.graph, disabled_key, [])
+    
+    def clear_cache(self):
+        """Drop memoized routes (needed only if edges/weights change)."""
+        self._disjoint_cached.cache_clear()
+        self._shortest_cached.cache_clear()
     
     def find_disjoint_paths(self, source, target):
         """Find two edge-disjoint paths between source and target."""
+        return self._disjoint_cached(source, target, self._disabled_key())
+    
+    def _find_disjoint_paths(self, source, target, disabled_key):
+        """
+        Tries the weighted shortest path followed by the shortest path on a
+        zero-copy view with its edges hidden. If that leaves no second path
+        (the first path can cut off every alternative), falls back to the
+        max-flow based edge_disjoint_paths, which finds one whenever it exists.
+        """
+        graph = self._active_graph(disabled_key)
         try:
             # First path - shortest path
-            path1 = nx.shortest_path(self.graph, source, target, weight='weight')
-            
-            # Create temporary graph without path1 edges
-            temp_graph = self.graph.copy()
-            for i in range(len(path1) - 1):
-                if temp_graph.has_edge(path1[i], path1[i+1]):
-                    temp_graph.remove_edge(path1[i], path1[i+1])
+            path1 = nx.shortest_path(graph, source, target, weight='weight')
             
-            # Second path
+            # Second path on a view without path1 edges
+            temp_graph = nx.restricted_view(graph, [], list(zip(path1, path1[1:])))
             try:
                 path2 = nx.shortest_path(temp_graph, source, target, weight='weight')
                 return path1, path2, True
             except nx.NetworkXNoPath:
-                return path1, None, False
+                pass
+            
+            paths = list(islice(nx.edge_disjoint_paths(graph, source, target), 2))
+            paths.sort(key=lambda p: nx.path_weight(graph, p, weight='weight'))
+            if len(paths) == 2:
+                return paths[0], paths[1], True
+            return path1, None, False
         except Exception as e:
             return None, None, False
     
     def get_shortest_path(self, source, target):
         """Get shortest path between nodes."""
+        return self._shortest_cached(source, target, self._disabled_key())
+    
+    def _get_shortest_path(self, source, target, disabled_key):
         try:
-            return nx.shortest_path(self.graph, source, target, weight='weight')
+            return nx.shortest_path(self._active_graph(disabled_key), source, target, weight='weight')
         except:
             return None
 
@@ -118,29 +204,101 @@ class BSTVisualizer:
         }
 
 
+def graph_to_csr(graph):
+    """
+    Encode an undirected NetworkX graph as CSR adjacency arrays.
+    
+    Returns:
+        tuple: (nodes, indptr, indices) where nodes maps index -> node id
+    """
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indices = []
+    for i, node in enumerate(nodes):
+        indices.extend(index[neighbor] for neighbor in graph.neighbors(node))
+        indptr[i + 1] = len(indices)
+    return nodes, indptr, np.array(indices, dtype=np.int64)
+
+
+@njit(cache=True)
+def _popcount64(x):
+    """Count set bits of a non-negative int64 with SWAR arithmetic (no loop)."""
+    x = x - ((x >> 1) & 0x5555555555555555)
+    x = (x & 0x3333333333333333) + ((x >> 2) & 0x3333333333333333)
+    x = (x + (x >> 4)) & 0x0F0F0F0F0F0F0F0F
+    x = x + (x >> 8)
+    x = x + (x >> 16)
+    x = x + (x >> 32)
+    return x & 0x7F
+
+
+@njit(cache=True)
+def _welsh_powell_csr(indptr, indices, order, num_colors):
+    """
+    Compiled Welsh-Powell over CSR adjacency.
+    
+    Args:
+        indptr, indices: CSR adjacency arrays
+        order: Node indices, highest degree first
+        num_colors: Palette size; nodes needing more colors stay -1
+    
+    Returns:
+        np.ndarray: Color index per node (-1 if uncolored)
+    """
+    colors = -np.ones(len(indptr) - 1, dtype=np.int64)
+    for node in order:
+        # Bitmask of colors used by neighbors
+        used = 0
+        for k in range(indptr[node], indptr[node + 1]):
+            c = colors[indices[k]]
+            if c >= 0:
+                used |= 1 << c
+        
+        # First available color: isolate the lowest zero bit of the mask;
+        # the bits below it, free - 1, number exactly color_id
+        free = ~used & (used + 1)
+        color_id = _popcount64(free - 1)
+        if color_id < num_colors:
+            colors[node] = color_id
+    return colors
+
+
 class GraphColorer:
     """Graph coloring using Welsh-Powell algorithm."""
     
     @staticmethod
     def color_graph(graph):
         """Apply Welsh-Powell coloring algorithm."""
-        colors = {}
         color_palette = ["red", "blue", "green", "yellow", "purple", "orange", "cyan"]
         
-        # Sort nodes by degree (descending)
-        sorted_nodes = sorted(graph.nodes(), key=lambda x: -graph.degree(x))
+        nodes, indptr, indices = graph_to_csr(graph)
+        # Sort nodes by degree (descending); stable, so ties keep node order
+        order = np.argsort(-np.diff(indptr), kind="stable")
         
-        for node in sorted_nodes:
-            # Find used colors by neighbors
-            neighbor_colors = {colors[neighbor] for neighbor in graph.neighbors(node) if neighbor in colors}
-            
-            # Assign first available color
-            for color_id in range(len(color_palette)):
-                if color_id not in neighbor_colors:
-                    colors[node] = color_id
-                    break
-        
-        return colors
+        node_colors = _welsh_powell_csr(indptr, indices, order, len(color_palette))
+        return {nodes[i]: int(node_colors[i]) for i in order if node_colors[i] >= 0}
+
+
+_PIL_FONTS = None
+
+
+def _pil_fonts():
+    """Load (edge weight, node label) fonts once, falling back to Pillow's default."""
+    global _PIL_FONTS
+    if _PIL_FONTS is None:
+        def load(names, size):
+            for name in names:
+                try:
+                    return ImageFont.truetype(name, size)
+                except OSError:
+                    pass
+            return ImageFont.load_default()
+        _PIL_FONTS = (
+            load(["arial.ttf", "DejaVuSans.ttf"], 12),
+            load(["arialbd.ttf", "DejaVuSans-Bold.ttf"], 13),
+        )
+    return _PIL_FONTS
 
 
 class SimulatorUI:
@@ -153,12 +311,14 @@ class SimulatorUI:
         
         # Initialize components
         self.network = NetworkGraph()
-        self.path_finder = PathFinder(self.network.graph)
+        self.path_finder = PathFinder(self.network.graph, self.network.disabled_nodes)
         self.bst_viz = BSTVisualizer()
         
         self.pos = self.network.get_node_positions()
-        self.selected_paths = []
-        self.mst_edges = []
+        self.selected_paths = frozenset()
+        self.mst_edges = frozenset()
+        # Canvas size, updated on <Configure> so redraws avoid Tk size queries
+        self._cw, self._ch = 800, 800
         
         self._build_ui()
         self._draw_canvas()
@@ -214,65 +374,108 @@ class SimulatorUI:
         self.canvas = tk.Canvas(canvas_panel, bg="white", cursor="hand2")
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.canvas.bind("<Button-3>", self._on_canvas_rightclick)
+        self.canvas.bind("<Configure>", self._on_resize)
+    
+    def _on_resize(self, event):
+        """Cache the new canvas size and redraw."""
+        self._cw, self._ch = event.width, event.height
+        self._draw_canvas()
     
     def _draw_canvas(self):
         """Draw network on canvas."""
         self.canvas.delete("all")
         
-        # Get canvas dimensions
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
+        # Canvas dimensions (cached by _on_resize)
+        width, height = self._cw, self._ch
         if width < 100 or height < 100:
             width, height = 800, 800
         
-        # Scale positions
-        x_coords = [self.pos[node][0] for node in self.network.get_nodes()]
-        y_coords = [self.pos[node][1] for node in self.network.get_nodes()]
+        # Hoist per-draw lookups out of the edge/node loops
+        nodes = self.network.get_nodes()
+        disabled = self.network.get_disabled_nodes()
+        pos = self.pos
+        mst_set = self.mst_edges
+        path_set = self.selected_paths
         
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
-        x_range = x_max - x_min if x_max > x_min else 1
-        y_range = y_max - y_min if y_max > y_min else 1
+        # Scale all positions to canvas coordinates in one vectorized pass
+        pts = np.array([pos[node] for node in nodes], dtype=float)
+        mins = pts.min(axis=0)
+        ranges = pts.max(axis=0) - mins
+        ranges[ranges <= 0] = 1
+        scaled = 50 + (pts - mins) / ranges * np.array([width - 100, height - 100])
+        node_to_xy = dict(zip(nodes, map(tuple, scaled.tolist())))
         
-        def transform(x, y):
-            tx = 50 + (x - x_min) / x_range * (width - 100)
-            ty = 50 + (y - y_min) / y_range * (height - 100)
-            return tx, ty
+        # With Pillow, render everything into one image shown as a single
+        # canvas item; otherwise fall back to one canvas item per shape
+        if PIL_AVAILABLE:
+            image = Image.new("RGB", (width, height), "white")
+            draw = ImageDraw.Draw(image)
+            weight_font, label_font = _pil_fonts()
+        else:
+            draw = None
         
         # Draw edges
-        for u, v, data in self.network.graph.edges(data=True):
-            if u in self.network.get_disabled_nodes() or v in self.network.get_disabled_nodes():
+        for u, v, w in self.network.graph.edges(data='weight'):
+            key = (u, v) if u <= v else (v, u)
+            if u in disabled or v in disabled:
                 edge_color = "gray"
-            elif (u, v) in self.mst_edges or (v, u) in self.mst_edges:
+            elif key in mst_set:
                 edge_color = "green"
-            elif [u, v] in self.selected_paths or [v, u] in self.selected_paths:
+            elif key in path_set:
                 edge_color = "blue"
             else:
                 edge_color = "black"
             
-            x1, y1 = transform(self.pos[u][0], self.pos[u][1])
-            x2, y2 = transform(self.pos[v][0], self.pos[v][1])
-            self.canvas.create_line(x1, y1, x2, y2, fill=edge_color, width=2)
-            
+            x1, y1 = node_to_xy[u]
+            x2, y2 = node_to_xy[v]
             mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-            self.canvas.create_text(mx, my, text=str(data['weight']), fill="red")
+            if draw is not None:
+                draw.line([(x1, y1), (x2, y2)], fill=edge_color, width=2)
+                draw.text((mx, my), str(w), fill="red", font=weight_font, anchor="mm")
+            else:
+                self.canvas.create_line(x1, y1, x2, y2, fill=edge_color, width=2)
+                self.canvas.create_text(mx, my, text=str(w), fill="red")
         
         # Draw nodes
-        for node in self.network.get_nodes():
-            x, y = transform(self.pos[node][0], self.pos[node][1])
+        for node in nodes:
+            x, y = node_to_xy[node]
             
-            if node in self.network.get_disabled_nodes():
+            if node in disabled:
                 node_color = "red"
             else:
                 node_color = "lightblue"
             
-            self.canvas.create_oval(x-15, y-15, x+15, y+15, fill=node_color, outline="black", width=2)
-            self.canvas.create_text(x, y, text=str(node), font=("Arial", 10, "bold"))
+            if draw is not None:
+                draw.ellipse([x-15, y-15, x+15, y+15], fill=node_color, outline="black", width=2)
+                draw.text((x, y), str(node), fill="black", font=label_font, anchor="mm")
+            else:
+                self.canvas.create_oval(x-15, y-15, x+15, y+15, fill=node_color, outline="black", width=2)
+                self.canvas.create_text(x, y, text=str(node), font=("Arial", 10, "bold"))
+        
+        if draw is not None:
+            # Keep a reference on self so Tk does not lose the image to GC
+            self._canvas_image = ImageTk.PhotoImage(image)
+            self.canvas.create_image(0, 0, anchor=tk.NW, image=self._canvas_image)
+    
+    @staticmethod
+    def _edge_set(edges):
+        """Normalize edges to a frozenset of (min, max) tuples for O(1) lookup."""
+        return frozenset((u, v) if u <= v else (v, u) for u, v in edges)
+    
+    @staticmethod
+    def _edges_and_str(path):
+        """Walk a path once, returning its normalized edges and display string."""
+        edges = []
+        labels = [str(path[0])]
+        for u, v in zip(path, path[1:]):
+            edges.append((u, v) if u <= v else (v, u))
+            labels.append(str(v))
+        return edges, ' -> '.join(labels)
     
     def _on_mst_click(self):
         """Handle MST computation."""
         edges, weight = self.network.compute_mst()
-        self.mst_edges = edges
+        self.mst_edges = self._edge_set(edges)
         self.status_area.delete(1.0, tk.END)
         self.status_area.insert(1.0, f"MST Computed\nTotal Weight: {weight}\nEdges: {len(edges)}")
         self._draw_canvas()
@@ -287,14 +490,14 @@ class SimulatorUI:
             
             self.status_area.delete(1.0, tk.END)
             if path1:
-                text = f"Path 1: {' -> '.join(map(str, path1))}\n"
+                edges1, str1 = self._edges_and_str(path1)
                 if path2:
-                    text += f"Path 2: {' -> '.join(map(str, path2))}"
-                    self.selected_paths = [[path1[i], path1[i+1]] for i in range(len(path1)-1)]
-                    self.selected_paths += [[path2[i], path2[i+1]] for i in range(len(path2)-1)]
+                    edges2, str2 = self._edges_and_str(path2)
+                    text = f"Path 1: {str1}\nPath 2: {str2}"
+                    self.selected_paths = frozenset(edges1 + edges2)
                 else:
-                    text += "Only 1 path found"
-                    self.selected_paths = [[path1[i], path1[i+1]] for i in range(len(path1)-1)]
+                    text = f"Path 1: {str1}\nOnly 1 path found"
+                    self.selected_paths = frozenset(edges1)
                 self.status_area.insert(1.0, text)
                 self._draw_canvas()
         except Exception as e:
@@ -330,8 +533,9 @@ class SimulatorUI:
     def _on_reset_click(self):
         """Reset simulator."""
         self.network = NetworkGraph()
-        self.selected_paths = []
-        self.mst_edges = []
+        self.path_finder = PathFinder(self.network.graph, self.network.disabled_nodes)
+        self.selected_paths = frozenset()
+        self.mst_edges = frozenset()
         self.status_area.delete(1.0, tk.END)
         self.status_area.insert(1.0, "Simulator reset")
         self._draw_canvas()
@@ -0,0 +1,38 @@
+# Cython declarations for Task6.py (pure-Python mode).
+#
+# Task6.py runs unchanged as plain Python. To compile it in place:
+#     cythonize -3 -i -X annotation_typing=False -X boundscheck=False -X wraparound=False Task6.py
+# (annotation_typing=False so the typing hints in Task6.py defer to the types
+# declared here). The resulting extension module is imported in preference to
+# Task6.py; delete the .so to go back to the pure-Python module.
+
+cimport cython
+
+
+# ---- Indexed heap used by astar_search ----
+
+@cython.locals(entry=tuple, parent=Py_ssize_t)
+cpdef _sift_up(list heap, dict pos, Py_ssize_t i)
+
+@cython.locals(n=Py_ssize_t, entry=tuple, child=Py_ssize_t)
+cpdef _sift_down(list heap, dict pos, Py_ssize_t i)
+
+cpdef heap_push(list heap, dict pos, object city, object f)
+
+@cython.locals(top=tuple, last=tuple)
+cpdef tuple heap_pop(list heap, dict pos)
+
+@cython.locals(i=Py_ssize_t)
+cpdef heap_decrease_key(list heap, dict pos, object city, object f)
+
+
+# ---- CSR fast path ----
+
+@cython.locals(current=Py_ssize_t, length=Py_ssize_t, i=Py_ssize_t, path=list)
+cpdef list reconstruct_path_from_ids(object parents, Py_ssize_t goal_id, object cities=*)
+
+@cython.locals(n=Py_ssize_t, closed=cython.uchar[::1], open_heap=list,
+               explored=Py_ssize_t, step=Py_ssize_t, u=Py_ssize_t, v=Py_ssize_t)
+# Returns a SearchResult, a tuple subclass that Cython's exact tuple type rejects
+cpdef astar_search_fast(Py_ssize_t start_id, Py_ssize_t goal_id, tuple adjacency,
+                        list h_arr)
@@ -1,12 +1,40 @@
 """
-Robot Delivery Path Finding - Functional Approach
-Pure functions for DFS, BFS, and A* with immutable data structures.
-Emphasizes composition, pure functions, and functional data handling.
+Robot Delivery Path Finding
+DFS, BFS, and A* over a weighted city graph. Each search updates its
+frontier, closed set and parent links in place; silent results are memoized
+in a module-level cache (see cached_search). Integer-id CSR variants of A*
+(optionally Numba-compiled) serve larger graphs.
 """
 
+from array import array
 from collections import deque
+from functools import wraps
 import heapq
-from typing import Tuple, List, Dict, Optional, Set
+import inspect
+import operator
+from typing import Callable, Tuple, List, Dict, NamedTuple, Optional, Sequence, Set
+
+try:
+    import cython
+    COMPILED = cython.compiled
+except ImportError:  # Cython is only needed to build the extension (see Task6.pxd)
+    COMPILED = False
+
+# Numba cannot JIT Cython-compiled functions, so a compiled build relies on
+# its own astar_search_fast instead
+NUMBA_AVAILABLE = False
+if not COMPILED:
+    try:
+        import numpy as np
+        from numba import njit
+        NUMBA_AVAILABLE = True
+    except ImportError:  # NumPy/Numba are optional; astar_search_fast is used instead
+        pass
+
+if not NUMBA_AVAILABLE:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return lambda func: func
 
 
 # ======================== GRAPH DATA ========================
@@ -36,27 +64,31 @@ HEURISTIC_DISTANCES = {
 START_CITY = 'Glogow'
 GOAL_CITY = 'Plock'
 
+# Shared adjacency for cities with no outgoing edges; never mutated
+_EMPTY: Dict[str, int] = {}
 
-# ======================== PURE UTILITY FUNCTIONS ========================
 
-def get_neighbors(city: str, graph: Dict) -> List[Tuple[str, int]]:
-    """Get list of (neighbor, distance) tuples for a city."""
-    return [(n, d) for n, d in graph.get(city, {}).items()]
+class SearchResult(NamedTuple):
+    """Outcome of one search; path is None when the goal is unreachable."""
+    path: Optional[List]
+    explored: int
+    steps: int
+
 
+# ======================== PURE UTILITY FUNCTIONS ========================
 
-def is_goal(city: str, goal: str) -> bool:
-    """Check if city is the goal."""
-    return city == goal
+# Goal checks are inlined as city == goal; the name stays for callers
+is_goal: Callable[[str, str], bool] = operator.eq
 
 
 def reconstruct_path_from_parents(parents: Dict[str, Optional[str]], goal: str) -> List[str]:
-    """Reconstruct path from parent dictionary."""
-    path = []
+    """Reconstruct path from parent dictionary (built front-first, no reversal)."""
+    path = deque()
     current = goal
     while current is not None:
-        path.append(current)
+        path.appendleft(current)
         current = parents.get(current)
-    return list(reversed(path))
+    return list(path)
 
 
 def calculate_path_cost(path: List[str], graph: Dict) -> int:
@@ -67,10 +99,13 @@ def calculate_path_cost(path: List[str], graph: Dict) -> int:
     )
 
 
-def format_step_output(step: int, current: str, open_set: List, closed_set: Set, extra: str = "") -> str:
-    """Format step information for display."""
+def format_step_output(step: int, current: str, open_set: List, closed_set: Set,
+                       extra: str = "", detail: str = "") -> str:
+    """Format step information for display (detail goes right after the city line)."""
     output = f"\nStep {step}:\n"
     output += f"  Current City: {current}\n"
+    if detail:
+        output += f"  {detail}\n"
     output += f"  Open Set: {open_set}\n"
     output += f"  Closed Set: {closed_set}\n"
     if extra:
@@ -78,6 +113,61 @@ def format_step_output(step: int, current: str, open_set: List, closed_set: Set,
     return output
 
 
+# ======================== RESULT CACHE ========================
+
+# Completed search results keyed by (search name, start, goal, ids of the
+# graph/heuristic arguments, graph version). Entries hold references to
+# those arguments so their ids cannot be reused while cached.
+_PATH_CACHE_MAX = 1024
+_path_cache: Dict[Tuple, Tuple[Tuple, SearchResult]] = {}
+_graph_version = 0
+
+
+def invalidate_path_cache() -> None:
+    """Call after mutating a graph or heuristic: bumps the version and drops cached results."""
+    global _graph_version
+    _graph_version += 1
+    _path_cache.clear()
+
+
+def cached_search(search: Callable) -> Callable:
+    """
+    Memoize a search(start, goal, graph, ...) entry point.
+    Arguments are bound against the search's own signature, so keyword and
+    positional calls share cache entries.
+    Silent calls (verbose=False) are answered from the cache; verbose calls
+    always run so the step trace is printed, and refresh the cached result.
+    """
+    name = search.__name__
+    sig = inspect.signature(search)
+    verbose_default = sig.parameters['verbose'].default
+    data_params = [p for p in sig.parameters if p not in ('start', 'goal', 'verbose')]
+    
+    @wraps(search)
+    def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        arguments = bound.arguments
+        verbose = arguments.get('verbose', verbose_default)
+        data = tuple(arguments[p] for p in data_params)
+        key = (name, arguments['start'], arguments['goal'], tuple(map(id, data)), _graph_version)
+        if not verbose:
+            hit = _path_cache.get(key)
+            if hit is not None:
+                cached = hit[1]
+                return cached if cached.path is None else cached._replace(path=list(cached.path))
+        
+        result = search(*bound.args, **bound.kwargs)
+        if key not in _path_cache and len(_path_cache) >= _PATH_CACHE_MAX:
+            del _path_cache[next(iter(_path_cache))]
+        if result.path is not None:
+            _path_cache[key] = (data, result._replace(path=list(result.path)))
+        else:
+            _path_cache[key] = (data, result)
+        return result
+    
+    return wrapper
+
+
 # ======================== DFS IMPLEMENTATION ========================
 
 def dfs_search_step(
@@ -87,111 +177,115 @@ def dfs_search_step(
     parents: Dict[str, Optional[str]],
     graph: Dict,
     step: int,
-    goal: str
-) -> Tuple[bool, List[str], int, List[str], Set[str], Dict]:
+    goal: str,
+    verbose: bool = True
+) -> Optional[List[str]]:
     """
     Single step of DFS search.
-    Returns: (found, path, new_step, new_open, new_closed, new_parents)
+    Updates open_stack, closed_set and parents in place.
+    Returns: path to the goal if current is the goal, else None
     """
-    print(f"\nStep {step}:")
-    print(f"  Current City: {current}")
-    print(f"  Open Set: {open_stack}")
-    print(f"  Closed Set: {closed_set}")
+    if verbose:
+        print(format_step_output(step, current, open_stack, closed_set), end="")
     
-    if is_goal(current, goal):
-        path = reconstruct_path_from_parents(parents, current)
-        return True, path, step, [], closed_set, parents
+    if current == goal:
+        return reconstruct_path_from_parents(parents, current)
     
-    new_closed = closed_set | {current}
-    new_open = open_stack.copy()
-    new_parents = parents.copy()
+    closed_set.add(current)
     
-    for neighbor, _ in reversed(get_neighbors(current, graph)):
-        if neighbor not in new_closed and neighbor not in new_open:
-            new_open.append(neighbor)
-            new_parents[neighbor] = current
-            print(f"  Adding to Open: {neighbor} (parent: {current})")
+    for neighbor in reversed(graph.get(current, _EMPTY)):
+        if neighbor not in closed_set and neighbor not in open_stack:
+            open_stack.append(neighbor)
+            parents[neighbor] = current
+            if verbose:
+                print(f"  Adding to Open: {neighbor} (parent: {current})")
     
-    return False, [], step, new_open, new_closed, new_parents
+    return None
 
 
-def dfs_search(start: str, goal: str, graph: Dict) -> Tuple[Optional[List[str]], int, int]:
+@cached_search
+def dfs_search(start: str, goal: str, graph: Dict, *,
+               verbose: bool = True) -> SearchResult:
     """
-    Depth-First Search using functional recursion pattern.
-    Returns: (path, nodes_explored, steps_taken)
+    Depth-First Search as an iterative frontier loop (no recursion limit).
+    With verbose=False the search runs silently.
+    Returns: SearchResult(path, explored, steps)
     """
-    print("\n" + "="*80)
-    print("DEPTH-FIRST SEARCH (DFS) - FUNCTIONAL")
-    print("="*80)
+    if verbose:
+        print("\n" + "="*80)
+        print("DEPTH-FIRST SEARCH (DFS) - FUNCTIONAL")
+        print("="*80)
     
-    def dfs_loop(open_stack: List[str], closed_set: Set[str], 
-                 parents: Dict[str, Optional[str]], step: int) -> Tuple[Optional[List[str]], int, int]:
-        """Recursive DFS loop."""
-        if not open_stack:
-            return None, len(closed_set), step
-        
+    open_stack = [start]
+    closed_set = set()
+    parents = {start: None}
+    step = 1
+    path = None
+    
+    while open_stack:
         current = open_stack.pop()
         
-        found, path, _, new_open, new_closed, new_parents = dfs_search_step(
-            current, open_stack, closed_set, parents, graph, step, goal
-        )
-        
-        if found:
-            return path, len(new_closed), step
+        path = dfs_search_step(current, open_stack, closed_set, parents, graph, step, goal, verbose)
+        if path is not None:
+            break
         
-        return dfs_loop(new_open, new_closed, new_parents, step + 1)
+        step += 1
     
-    path, explored, steps = dfs_loop([start], set(), {start: None}, 1)
+    explored, steps = len(closed_set), step
     
-    if path:
+    if path and verbose:
         print(f"\n✓ GOAL FOUND: {goal}")
     
-    return path, explored, steps
+    return SearchResult(path, explored, steps)
 
 
 # ======================== BFS IMPLEMENTATION ========================
 
-def bfs_search(start: str, goal: str, graph: Dict) -> Tuple[Optional[List[str]], int, int]:
+@cached_search
+def bfs_search(start: str, goal: str, graph: Dict, *,
+               verbose: bool = True) -> SearchResult:
     """
-    Breadth-First Search using functional composition.
-    Returns: (path, nodes_explored, steps_taken)
+    Breadth-First Search as an iterative frontier loop (no recursion limit).
+    With verbose=False the search runs silently.
+    Returns: SearchResult(path, explored, steps)
     """
-    print("\n" + "="*80)
-    print("BREADTH-FIRST SEARCH (BFS) - FUNCTIONAL")
-    print("="*80)
+    if verbose:
+        print("\n" + "="*80)
+        print("BREADTH-FIRST SEARCH (BFS) - FUNCTIONAL")
+        print("="*80)
     
-    def bfs_loop(open_queue: deque, closed_set: Set[str], 
-                 parents: Dict[str, Optional[str]], step: int) -> Tuple[Optional[List[str]], int, int]:
-        """Recursive BFS loop with queue."""
-        if not open_queue:
-            return None, len(closed_set), step
-        
+    open_queue = deque([start])
+    open_set = {start}  # mirrors open_queue for O(1) membership tests
+    closed_set = set()
+    parents = {start: None}
+    step = 1
+    
+    while open_queue:
         current = open_queue.popleft()
+        open_set.discard(current)
         
-        print(f"\nStep {step}:")
-        print(f"  Current City: {current}")
-        print(f"  Open Set: {list(open_queue)}")
-        print(f"  Closed Set: {closed_set}")
+        if verbose:
+            print(format_step_output(step, current, list(open_queue), closed_set), end="")
         
-        if is_goal(current, goal):
+        if current == goal:
             path = reconstruct_path_from_parents(parents, current)
-            print(f"\n✓ GOAL FOUND: {goal}")
-            return path, len(closed_set | {current}), step
+            if verbose:
+                print(f"\n✓ GOAL FOUND: {goal}")
+            return SearchResult(path, len(closed_set) + 1, step)
         
-        new_closed = closed_set | {current}
-        new_queue = deque(open_queue)
-        new_parents = parents.copy()
+        closed_set.add(current)
         
-        for neighbor, _ in get_neighbors(current, graph):
-            if neighbor not in new_closed and neighbor not in new_queue:
-                new_queue.append(neighbor)
-                new_parents[neighbor] = current
-                print(f"  Adding to Open: {neighbor} (parent: {current})")
+        for neighbor in graph.get(current, _EMPTY):
+            if neighbor not in closed_set and neighbor not in open_set:
+                open_queue.append(neighbor)
+                open_set.add(neighbor)
+                parents[neighbor] = current
+                if verbose:
+                    print(f"  Adding to Open: {neighbor} (parent: {current})")
         
-        return bfs_loop(new_queue, new_closed, new_parents, step + 1)
+        step += 1
     
-    path, explored, steps = bfs_loop(deque([start]), set(), {start: None}, 1)
-    return path, explored, steps
+    return SearchResult(None, len(closed_set), step)
 
 
 # ======================== A* IMPLEMENTATION ========================
@@ -206,32 +300,98 @@ def expand_node(
     g_scores: Dict[str, int],
     heuristic: Dict[str, int],
     graph: Dict
-) -> List[Tuple[int, str]]:
+) -> List[Tuple[int, str, int]]:
     """
     Generate f-scores for neighbors.
-    Returns list of (f_score, neighbor).
+    Returns list of (f_score, neighbor, g_score).
     """
     neighbors = []
-    for neighbor, edge_cost in get_neighbors(current, graph):
+    h = heuristic.get
+    inf = float('inf')
+    for neighbor, edge_cost in graph.get(current, _EMPTY).items():
         new_g = g_scores[current] + edge_cost
-        h = heuristic.get(neighbor, float('inf'))
-        f = calculate_f_score(new_g, h)
+        f = calculate_f_score(new_g, h(neighbor, inf))
         neighbors.append((f, neighbor, new_g))
     return neighbors
 
 
-def astar_search(start: str, goal: str, graph: Dict, heuristic: Dict) -> Tuple[Optional[List[str]], int, int]:
+def _sift_up(heap: List[Tuple[int, str]], pos: Dict[str, int], i: int) -> None:
+    """Move heap[i] up until its parent has a smaller or equal f-score."""
+    entry = heap[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap[parent][0] <= entry[0]:
+            break
+        heap[i] = heap[parent]
+        pos[heap[i][1]] = i
+        i = parent
+    heap[i] = entry
+    pos[entry[1]] = i
+
+
+def _sift_down(heap: List[Tuple[int, str]], pos: Dict[str, int], i: int) -> None:
+    """Move heap[i] down until both children have larger or equal f-scores."""
+    n = len(heap)
+    entry = heap[i]
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and heap[child + 1][0] < heap[child][0]:
+            child += 1
+        if entry[0] <= heap[child][0]:
+            break
+        heap[i] = heap[child]
+        pos[heap[i][1]] = i
+        i = child
+    heap[i] = entry
+    pos[entry[1]] = i
+
+
+def heap_push(heap: List[Tuple[int, str]], pos: Dict[str, int], city: str, f: int) -> None:
+    """Insert city with priority f, recording its heap index in pos."""
+    heap.append((f, city))
+    _sift_up(heap, pos, len(heap) - 1)
+
+
+def heap_pop(heap: List[Tuple[int, str]], pos: Dict[str, int]) -> Tuple[int, str]:
+    """Remove and return the (f, city) entry with the smallest f."""
+    top = heap[0]
+    del pos[top[1]]
+    last = heap.pop()
+    if heap:
+        heap[0] = last
+        _sift_down(heap, pos, 0)
+    return top
+
+
+def heap_decrease_key(heap: List[Tuple[int, str]], pos: Dict[str, int], city: str, f: int) -> None:
+    """Lower the priority of a city already in the heap."""
+    i = pos[city]
+    heap[i] = (f, city)
+    _sift_up(heap, pos, i)
+
+
+@cached_search
+def astar_search(start: str, goal: str, graph: Dict, heuristic: Dict, *,
+                 verbose: bool = True) -> SearchResult:
     """
     A* Search using functional composition with priority queue.
-    Returns: (path, nodes_explored, steps_taken)
+    With verbose=False the search runs silently (no open-set snapshots).
+    Returns: SearchResult(path, explored, steps)
     """
-    print("\n" + "="*80)
-    print("A* SEARCH - FUNCTIONAL")
-    print("="*80)
+    if verbose:
+        print("\n" + "="*80)
+        print("A* SEARCH - FUNCTIONAL")
+        print("="*80)
     
-    counter = 0
-    open_heap = [(heuristic[start], counter, start)]
-    counter += 1
+    # Indexed binary heap: pos maps each open city to its heap slot, so an
+    # improved g-score is a decrease-key rather than a duplicate entry
+    h = heuristic.get
+    inf = float('inf')
+    open_heap = []
+    pos = {}
+    heap_push(open_heap, pos, start, h(start, inf))
     
     g_scores = {start: 0}
     closed_set = set()
@@ -239,23 +399,18 @@ def astar_search(start: str, goal: str, graph: Dict, heuristic: Dict) -> Tuple[O
     step = 1
     
     while open_heap:
-        f_score, _, current = heapq.heappop(open_heap)
-        
-        if current in closed_set:
-            continue
+        f_score, current = heap_pop(open_heap, pos)
         
-        open_cities = [c for _, _, c in open_heap]
+        if verbose:
+            detail = f"f(n) = g(n) + h(n) = {g_scores[current]} + {h(current, inf)} = {f_score}"
+            open_cities = [c for _, c in open_heap]
+            print(format_step_output(step, current, open_cities, closed_set, detail=detail), end="")
         
-        print(f"\nStep {step}:")
-        print(f"  Current City: {current}")
-        print(f"  f(n) = g(n) + h(n) = {g_scores[current]} + {heuristic[current]} = {f_score}")
-        print(f"  Open Set: {open_cities}")
-        print(f"  Closed Set: {closed_set}")
-        
-        if is_goal(current, goal):
+        if current == goal:
             path = reconstruct_path_from_parents(parents, current)
-            print(f"\n✓ GOAL FOUND: {goal}")
-            return path, len(closed_set) + 1, step
+            if verbose:
+                print(f"\n✓ GOAL FOUND: {goal}")
+            return SearchResult(path, len(closed_set) + 1, step)
         
         closed_set.add(current)
         
@@ -264,47 +419,406 @@ def astar_search(start: str, goal: str, graph: Dict, heuristic: Dict) -> Tuple[O
                 if neighbor not in g_scores or new_g < g_scores[neighbor]:
                     g_scores[neighbor] = new_g
                     parents[neighbor] = current
-                    heapq.heappush(open_heap, (f_val, counter, neighbor))
-                    counter += 1
-                    print(f"  Adding/Updating {neighbor}: g={new_g}, h={heuristic[neighbor]}, f={f_val}")
+                    if neighbor in pos:
+                        heap_decrease_key(open_heap, pos, neighbor, f_val)
+                    else:
+                        heap_push(open_heap, pos, neighbor, f_val)
+                    if verbose:
+                        print(f"  Adding/Updating {neighbor}: g={new_g}, h={h(neighbor, inf)}, f={f_val}")
+        
+        step += 1
+    
+    return SearchResult(None, len(closed_set), step)
+
+
+def reverse_graph(graph: Dict) -> Dict[str, Dict[str, int]]:
+    """Build the edge-reversed graph (needed by bidirectional search on directed graphs)."""
+    rev: Dict[str, Dict[str, int]] = {city: {} for city in graph}
+    for city, neighbors in graph.items():
+        for neighbor, distance in neighbors.items():
+            rev.setdefault(neighbor, {})[city] = distance
+    return rev
+
+
+def astar_bidirectional(
+    start: str,
+    goal: str,
+    graph: Dict,
+    heuristic_fwd: Dict,
+    heuristic_bwd: Optional[Dict] = None,
+    graph_rev: Optional[Dict] = None
+) -> SearchResult:
+    """
+    Silent bidirectional A*: one search from start guided by heuristic_fwd
+    (estimates to goal), one from goal guided by heuristic_bwd (estimates to
+    start; zero if omitted). mu is the best start-goal cost seen where the
+    two searches touch; once they have met, the search stops when either
+    frontier's smallest f reaches mu, or either frontier empties.
+    graph_rev defaults to graph, which is correct for undirected graphs such
+    as CITY_GRAPH; pass reverse_graph(graph) for directed ones.
+    Returns: SearchResult(path, explored, steps)
+    """
+    if start == goal:
+        return SearchResult([start], 1, 1)
+    
+    inf = float('inf')
+    adjacency = (graph, graph if graph_rev is None else graph_rev)
+    # Cities missing from a heuristic get inf; an omitted heuristic_bwd is zero
+    h = (heuristic_fwd.get, (heuristic_bwd or _EMPTY).get)
+    h_missing = (inf, inf if heuristic_bwd else 0)
+    
+    g = ({start: 0}, {goal: 0})
+    parents = ({start: None}, {goal: None})
+    closed = (set(), set())
+    heaps = ([(h[0](start, inf), start)], [(h[1](goal, h_missing[1]), goal)])
+    
+    mu = inf
+    meet = None
+    steps = 0
+    
+    while True:
+        # Drop entries settled since they were pushed
+        for side in (0, 1):
+            heap = heaps[side]
+            while heap and heap[0][1] in closed[side]:
+                heapq.heappop(heap)
+        if not heaps[0] or not heaps[1]:
+            break
+        # mu is inf until the searches meet; an f = inf top (city missing
+        # from the heuristic) is no reason to stop before then
+        if meet is not None and (heaps[0][0][0] >= mu or heaps[1][0][0] >= mu):
+            break
+        
+        # Expand the smaller frontier
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        other = 1 - side
+        _, u = heapq.heappop(heaps[side])
+        closed[side].add(u)
+        steps += 1
+        
+        g_side, g_other = g[side], g[other]
+        g_u = g_side[u]
+        for v, distance in adjacency[side].get(u, _EMPTY).items():
+            if v in closed[side]:
+                continue
+            new_g = g_u + distance
+            if new_g < g_side.get(v, inf):
+                g_side[v] = new_g
+                parents[side][v] = u
+                heapq.heappush(heaps[side], (new_g + h[side](v, h_missing[side]), v))
+                if v in g_other and new_g + g_other[v] < mu:
+                    mu = new_g + g_other[v]
+                    meet = v
+    
+    explored = len(closed[0]) + len(closed[1])
+    if meet is None:
+        return SearchResult(None, explored, steps)
+    
+    path = reconstruct_path_from_parents(parents[0], meet)
+    current = parents[1][meet]
+    while current is not None:
+        path.append(current)
+        current = parents[1][current]
+    return SearchResult(path, explored, steps)
+
+
+# ======================== CSR FAST PATH ========================
+
+def build_city_ids(graph: Dict) -> Dict[str, int]:
+    """Number every city in the graph, including neighbor-only cities."""
+    id_of = {city: i for i, city in enumerate(graph)}
+    for neighbors in graph.values():
+        for neighbor in neighbors:
+            id_of.setdefault(neighbor, len(id_of))
+    return id_of
+
+
+def build_csr(graph: Dict) -> Tuple[Dict[str, int], List[int], List[int], List[int]]:
+    """
+    Encode a city graph as integer ids with CSR adjacency.
+    Returns: (id_of, indptr, indices, weights); neighbors of city id u are
+    indices[indptr[u]:indptr[u+1]] with matching weights.
+    """
+    id_of = build_city_ids(graph)
+    indptr = [0]
+    indices = []
+    weights = []
+    for city in id_of:
+        for neighbor, distance in graph.get(city, _EMPTY).items():
+            indices.append(id_of[neighbor])
+            weights.append(distance)
+        indptr.append(len(indices))
+    return id_of, indptr, indices, weights
+
+
+def build_adjacency(
+    indptr: List[int],
+    indices: List[int],
+    weights: List[int]
+) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Freeze CSR arrays into read-only per-city tuples.
+    Returns: adjacency where adjacency[u] is a tuple of (neighbor_id, weight).
+    """
+    return tuple(
+        tuple(zip(indices[indptr[u]:indptr[u + 1]], weights[indptr[u]:indptr[u + 1]]))
+        for u in range(len(indptr) - 1)
+    )
+
+
+# CITY_GRAPH is constant, so its id adjacency is built once at import
+CITY_IDS, _indptr, _indices, _weights = build_csr(CITY_GRAPH)
+GRAPH_T = build_adjacency(_indptr, _indices, _weights)
+del _indptr, _indices, _weights
+
+
+def build_heuristic_array(id_of: Dict[str, int], heuristic: Dict[str, int]) -> List[float]:
+    """Heuristic values indexed by city id (inf where unknown)."""
+    inf = float('inf')
+    h_arr = [inf] * len(id_of)
+    for city, i in id_of.items():
+        h_arr[i] = heuristic.get(city, inf)
+    return h_arr
+
+
+def reconstruct_path_from_ids(
+    parents: Sequence[int],
+    goal_id: int,
+    cities: Optional[Sequence[str]] = None
+) -> List:
+    """
+    Reconstruct a path from a parent array (-1 marks the start).
+    One walk counts the hops, a second fills a preallocated list from the tail.
+    Returns: id path, or city names when cities (indexed by id) is given.
+    """
+    length = 0
+    current = goal_id
+    while current != -1:
+        length += 1
+        current = parents[current]
+    
+    path = [None] * length
+    current = goal_id
+    for i in range(length - 1, -1, -1):
+        path[i] = current if cities is None else cities[current]
+        current = parents[current]
+    return path
+
+
+def astar_search_fast(
+    start_id: int,
+    goal_id: int,
+    adjacency: Tuple[Tuple[Tuple[int, int], ...], ...],
+    h_arr: List[float]
+) -> SearchResult:
+    """
+    Silent A* over integer city ids (see build_adjacency, e.g. GRAPH_T).
+    Uses heapq on (f, city_id) entries: int ids settle f ties, so no counter
+    is needed, and the sticky closed bytearray discards stale entries.
+    g-scores and parents live in typed arrays indexed by city id.
+    Returns: SearchResult(id path, explored, steps)
+    """
+    n = len(adjacency)
+    closed = bytearray(n)
+    g = array('d', [float('inf')]) * n
+    parents = array('l', [-1]) * n
+    g[start_id] = 0
+    
+    open_heap = [(h_arr[start_id], start_id)]
+    explored = 0
+    step = 1
+    
+    while open_heap:
+        _, u = heapq.heappop(open_heap)
+        if closed[u]:
+            continue
+        
+        if u == goal_id:
+            return SearchResult(reconstruct_path_from_ids(parents, u), explored + 1, step)
+        
+        closed[u] = 1
+        explored += 1
+        g_u = g[u]
+        
+        for v, w in adjacency[u]:
+            if closed[v]:
+                continue
+            new_g = g_u + w
+            if new_g < g[v]:
+                g[v] = new_g
+                parents[v] = u
+                heapq.heappush(open_heap, (new_g + h_arr[v], v))
+        
+        step += 1
+    
+    return SearchResult(None, explored, step)
+
+
+# Below this many cities the JIT call overhead outweighs the compiled loop
+NUMBA_MIN_NODES = 64
+
+
+@njit(cache=True)
+def _nb_sift_up(heap, heap_f, pos, i):
+    """Move heap slot i up while its parent has a larger f-score."""
+    node = heap[i]
+    f = heap_f[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap_f[parent] <= f:
+            break
+        heap[i] = heap[parent]
+        heap_f[i] = heap_f[parent]
+        pos[heap[i]] = i
+        i = parent
+    heap[i] = node
+    heap_f[i] = f
+    pos[node] = i
+
+
+@njit(cache=True)
+def _nb_sift_down(heap, heap_f, pos, i, size):
+    """Move heap slot i down while a child has a smaller f-score."""
+    node = heap[i]
+    f = heap_f[i]
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_f[child + 1] < heap_f[child]:
+            child += 1
+        if f <= heap_f[child]:
+            break
+        heap[i] = heap[child]
+        heap_f[i] = heap_f[child]
+        pos[heap[i]] = i
+        i = child
+    heap[i] = node
+    heap_f[i] = f
+    pos[node] = i
+
+
+@njit(cache=True)
+def _astar_csr_core(start, goal, indptr, indices, weights, h_arr):
+    """
+    Compiled A* over CSR arrays with a preallocated indexed binary heap.
+    
+    Returns:
+        tuple: (parents[n], found, explored, steps)
+    """
+    n = indptr.shape[0] - 1
+    closed = np.zeros(n, dtype=np.uint8)
+    g = np.full(n, np.inf)
+    parents = np.full(n, -1, dtype=np.int64)
+    heap = np.empty(n, dtype=np.int64)
+    heap_f = np.empty(n, dtype=np.float64)
+    pos = np.full(n, -1, dtype=np.int64)
+    
+    g[start] = 0.0
+    heap[0] = start
+    heap_f[0] = h_arr[start]
+    pos[start] = 0
+    size = 1
+    explored = 0
+    step = 1
+    
+    while size > 0:
+        u = heap[0]
+        pos[u] = -1
+        size -= 1
+        if size > 0:
+            heap[0] = heap[size]
+            heap_f[0] = heap_f[size]
+            pos[heap[0]] = 0
+            _nb_sift_down(heap, heap_f, pos, 0, size)
+        
+        if u == goal:
+            return parents, True, explored + 1, step
+        
+        closed[u] = 1
+        explored += 1
+        g_u = g[u]
+        
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if closed[v]:
+                continue
+            new_g = g_u + weights[k]
+            if new_g < g[v]:
+                g[v] = new_g
+                parents[v] = u
+                f_val = new_g + h_arr[v]
+                if pos[v] >= 0:
+                    heap_f[pos[v]] = f_val
+                    _nb_sift_up(heap, heap_f, pos, pos[v])
+                else:
+                    heap[size] = v
+                    heap_f[size] = f_val
+                    size += 1
+                    _nb_sift_up(heap, heap_f, pos, size - 1)
         
         step += 1
     
-    return None, len(closed_set), step
+    return parents, False, explored, step
+
+
+def astar_search_numba(
+    start_id: int,
+    goal_id: int,
+    indptr: List[int],
+    indices: List[int],
+    weights: List[int],
+    h_arr: List[float]
+) -> SearchResult:
+    """
+    A* over CSR arrays, JIT-compiled with Numba for large graphs.
+    Falls back to astar_search_fast when Numba is unavailable or the graph
+    has fewer than NUMBA_MIN_NODES cities.
+    Returns: SearchResult(id path, explored, steps)
+    """
+    if not NUMBA_AVAILABLE or len(indptr) - 1 < NUMBA_MIN_NODES:
+        return astar_search_fast(
+            start_id, goal_id, build_adjacency(indptr, indices, weights), h_arr
+        )
+    
+    parents, found, explored, steps = _astar_csr_core(
+        start_id, goal_id,
+        np.asarray(indptr, dtype=np.int64),
+        np.asarray(indices, dtype=np.int64),
+        np.asarray(weights, dtype=np.float64),
+        np.asarray(h_arr, dtype=np.float64),
+    )
+    path = reconstruct_path_from_ids(parents.tolist(), goal_id) if found else None
+    return SearchResult(path, int(explored), int(steps))
 
 
 # ======================== REPORT GENERATION ========================
 
 def generate_comparison_report(
-    results: Dict[str, Tuple[Optional[List[str]], int, int]]
+    results: Dict[str, SearchResult]
 ) -> None:
     """Generate functional comparative analysis report."""
     print("\n" + "="*80)
     print("COMPARATIVE ANALYSIS REPORT")
     print("="*80)
     
-    dfs_path, dfs_explored, dfs_steps = results['DFS']
-    bfs_path, bfs_explored, bfs_steps = results['BFS']
-    astar_path, astar_explored, astar_steps = results['A*']
-    
-    for algo, path, explored, steps in [
-        ('DFS', dfs_path, dfs_explored, dfs_steps),
-        ('BFS', bfs_path, bfs_explored, bfs_steps),
-        ('A*', astar_path, astar_explored, astar_steps),
-    ]:
+    costs: Dict[str, Optional[int]] = {}
+    for algo, r in results.items():
+        path = r.path
         print(f"\n{algo}:")
+        costs[algo] = calculate_path_cost(path, CITY_GRAPH) if path else None
         if path:
-            cost = calculate_path_cost(path, CITY_GRAPH)
+            cost = costs[algo]
             print(f"  Path: {' -> '.join(path)}")
             print(f"  Cost: {cost} km, Length: {len(path)-1} edges")
         else:
             print(f"  No path found")
-        print(f"  Nodes Explored: {explored}, Steps: {steps}")
+        print(f"  Nodes Explored: {r.explored}, Steps: {r.steps}")
     
     # Optimality check
-    if astar_path and bfs_path:
-        astar_cost = calculate_path_cost(astar_path, CITY_GRAPH)
-        bfs_cost = calculate_path_cost(bfs_path, CITY_GRAPH)
+    if results['A*'].path and results['BFS'].path:
+        astar_cost = costs['A*']
+        bfs_cost = costs['BFS']
         print(f"\nOptimality: A* {'≤' if astar_cost <= bfs_cost else '>'} BFS")
     
     print("\nRecommendation: Use A* for robot delivery (optimal with good heuristic)")